@@ -27,13 +27,14 @@ afterAll(async () => {
   }
 });
 
-// Clean up collections between tests
+// Clean up collections between tests. Documents are cleared rather than the
+// collections dropped, so indexes built in beforeAll hooks survive.
 afterEach(async () => {
   if (testDb) {
-    const collections = await testDb.listCollections().toArray();
-    for (const collection of collections) {
-      await testDb.collection(collection.name).deleteMany({});
-    }
+    const collections = await testDb.listCollections({}, { nameOnly: true }).toArray();
+    await Promise.all(
+      collections.map(collection => testDb.collection(collection.name).deleteMany({}))
+    );
   }
 });
 
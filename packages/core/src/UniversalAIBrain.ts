@@ -15,7 +15,7 @@
  * - Production-ready with enterprise-grade reliability
  */
 
-import { MongoClient, Db } from 'mongodb';
+import { MongoClient, Db, MongoClientOptions } from 'mongodb';
 import { MongoVectorStore } from './vector/MongoVectorStore';
 
 // Core Collections
@@ -212,6 +212,16 @@ const DEFAULT_CONFIG = {
   }
 };
 
+// Keep a few warm sockets so the first queries skip the TLS handshake,
+// compress the embedding-heavy wire traffic, and fail fast when Atlas is unreachable
+const DEFAULT_MONGO_CLIENT_OPTIONS: MongoClientOptions = {
+  minPoolSize: 5,
+  maxPoolSize: 20,
+  serverSelectionTimeoutMS: 5000,
+  retryWrites: true,
+  compressors: ['snappy', 'zlib']
+};
+
 /**
  * UniversalAIBrain - The central orchestrator for AI intelligence
  *
@@ -286,7 +296,7 @@ export class UniversalAIBrain {
 
   constructor(config: UniversalAIBrainConfig | SimpleAIBrainConfig) {
     this.config = this.buildFullConfig(config);
-    this.mongoClient = new MongoClient(this.config.mongodb!.connectionString);
+    this.mongoClient = new MongoClient(this.config.mongodb!.connectionString, DEFAULT_MONGO_CLIENT_OPTIONS);
     this.mongoConnection = this.mongoClient; // Initialize mongoConnection
   }
 
@@ -5,21 +5,66 @@
  * These tests validate the production-ready vector search capabilities.
  */
 
-import { MongoVectorStore, EmbeddingProvider, VectorSearchOptions } from '../vector/MongoVectorStore';
+import { MongoVectorStore, EmbeddingProvider, VectorSearchOptions, fusionScoreStages, fusionCombineStages } from '../vector/MongoVectorStore';
 import { setupTestDb, teardownTestDb, getTestDb } from './setup';
 import { Db } from 'mongodb';
 
+const MOCK_DIMENSIONS = 1536;
+
+// sin(i)/cos(i) per dimension, so sin(seed + i) can be built by angle addition
+// with two trig calls per embedding instead of one per dimension
+const SIN_BY_DIMENSION = Float64Array.from({ length: MOCK_DIMENSIONS }, (_, i) => Math.sin(i));
+const COS_BY_DIMENSION = Float64Array.from({ length: MOCK_DIMENSIONS }, (_, i) => Math.cos(i));
+
 // Mock embedding provider for testing
 class MockEmbeddingProvider implements EmbeddingProvider {
-  private dimensions = 1536;
+  private dimensions = MOCK_DIMENSIONS;
   private model = 'text-embedding-ada-002';
+  // Fixtures are re-seeded before every test, so the same texts come back
+  private embeddingCache = new Map<string, number[]>();
 
   async generateEmbedding(text: string): Promise<number[]> {
-    // Generate deterministic embeddings for testing
-    const hash = this.simpleHash(text);
-    return Array(this.dimensions).fill(0).map((_, i) => 
-      Math.sin(hash + i) * 0.5 + 0.5
-    );
+    const cached = this.embeddingCache.get(text);
+    if (cached) {
+      return cached;
+    }
+
+    // Generate deterministic embeddings for testing: hash and fill in one
+    // tight, monomorphic pass so V8 can optimize it after the warm-up call
+    let hash = 0;
+    for (let i = 0; i < text.length; i++) {
+      hash = (((hash << 5) - hash) + text.charCodeAt(i)) | 0; // 32-bit integer
+    }
+    const seed = Math.abs(hash) / 1000000;
+    const sinSeed = Math.sin(seed);
+    const cosSeed = Math.cos(seed);
+
+    // ada-002 vectors are unit length: accumulate the norm while filling,
+    // then scale in place rather than making separate passes
+    const embedding = new Float64Array(this.dimensions);
+    let sumOfSquares = 0;
+    for (let i = 0; i < embedding.length; i++) {
+      // sin(seed + i) = sin(seed)cos(i) + cos(seed)sin(i)
+      const value = (sinSeed * COS_BY_DIMENSION[i] + cosSeed * SIN_BY_DIMENSION[i]) * 0.5 + 0.5;
+      embedding[i] = value;
+      sumOfSquares += value * value;
+    }
+    if (sumOfSquares > 0) {
+      const scale = 1 / Math.sqrt(sumOfSquares);
+      for (let i = 0; i < embedding.length; i++) {
+        embedding[i] *= scale;
+      }
+    }
+    // Convert only at the boundary - the driver serializes plain arrays
+    const result = Array.from(embedding);
+    this.embeddingCache.set(text, result);
+    return result;
+  }
+
+  // Mirrors the real providers, which drop blank texts before calling the API
+  async generateEmbeddings(texts: string[]): Promise<number[][]> {
+    const validTexts = texts.filter(text => text && text.trim().length > 0);
+    return Promise.all(validTexts.map(text => this.generateEmbedding(text)));
   }
 
   getDimensions(): number {
@@ -29,16 +74,6 @@ class MockEmbeddingProvider implements EmbeddingProvider {
   getModel(): string {
     return this.model;
   }
-
-  private simpleHash(str: string): number {
-    let hash = 0;
-    for (let i = 0; i < str.length; i++) {
-      const char = str.charCodeAt(i);
-      hash = ((hash << 5) - hash) + char;
-      hash = hash & hash; // Convert to 32-bit integer
-    }
-    return Math.abs(hash) / 1000000;
-  }
 }
 
 // Mock MongoConnection for testing
@@ -78,6 +113,8 @@ describe('MongoVectorStore', () => {
     );
 
     embeddingProvider = new MockEmbeddingProvider();
+    // Warm the embedding hot path so the first test doesn't pay for it
+    await embeddingProvider.generateEmbedding('warm-up');
     await vectorStore.initialize(embeddingProvider);
   }, 60000); // 60 second timeout for setup
 
@@ -151,6 +188,93 @@ describe('MongoVectorStore', () => {
       const storedDoc = await vectorStore.getDocument(documentId, true);
       expect(storedDoc!.embedding).toEqual(customEmbedding);
     });
+
+    it('should pair generated embeddings with their documents in a mixed batch', async () => {
+      const customEmbedding = Array(1536).fill(0).map(() => Math.random());
+      const documents = [
+        { text: 'Generated embedding one', source: 'mixed' },
+        { text: 'Provided embedding', source: 'mixed', embedding: customEmbedding },
+        { text: 'Generated embedding two', source: 'mixed' }
+      ];
+
+      const documentIds = await vectorStore.storeDocuments(documents);
+
+      const stored = await Promise.all(documentIds.map(id => vectorStore.getDocument(id, true)));
+      expect(stored[0]!.embedding).toEqual(await embeddingProvider.generateEmbedding('Generated embedding one'));
+      expect(stored[1]!.embedding).toEqual(customEmbedding);
+      expect(stored[2]!.embedding).toEqual(await embeddingProvider.generateEmbedding('Generated embedding two'));
+    });
+
+    it('should reject a batch with empty text and no embedding', async () => {
+      const documents = [
+        { text: 'Generated embedding one', source: 'mixed' },
+        { text: '   ', source: 'mixed' },
+        { text: 'Provided embedding', source: 'mixed', embedding: Array(1536).fill(0.1) },
+        { text: 'Generated embedding two', source: 'mixed' }
+      ];
+
+      await expect(vectorStore.storeDocuments(documents)).rejects.toThrow('Text cannot be empty');
+      const count = await mockConnection.getDb().collection('test_vector_collection').countDocuments({ source: 'mixed' });
+      expect(count).toBe(0);
+    });
+  });
+
+  describe('Embedding Encoding', () => {
+    const createStore = async (collectionName: string, encoding: 'array' | 'float32' | 'int8') => {
+      const store = new MongoVectorStore(mockConnection as any, collectionName, 'test_vector_index', 'test_text_index', encoding);
+      await store.initialize(embeddingProvider);
+      await mockConnection.getDb().collection(collectionName).deleteMany({});
+      return store;
+    };
+
+    it('should round-trip float32 embeddings', async () => {
+      const store = await createStore('test_vector_float32', 'float32');
+      const embedding = await embeddingProvider.generateEmbedding('Float32 storage test');
+
+      const documentId = await store.storeDocument('Float32 storage test', {}, 'encoding', embedding);
+
+      const storedDoc = await store.getDocument(documentId, true);
+      expect(storedDoc!.embedding).toEqual(Array.from(Float32Array.from(embedding)));
+    });
+
+    it('should round-trip float32 embeddings through storeDocuments', async () => {
+      const store = await createStore('test_vector_float32', 'float32');
+
+      const [documentId] = await store.storeDocuments([{ text: 'Float32 batch test', source: 'encoding' }]);
+
+      const storedDoc = await store.getDocument(documentId, true);
+      const expected = await embeddingProvider.generateEmbedding('Float32 batch test');
+      expect(storedDoc!.embedding).toEqual(Array.from(Float32Array.from(expected)));
+    });
+
+    it('should round-trip int8 embeddings within quantization error', async () => {
+      const store = await createStore('test_vector_int8', 'int8');
+      const embedding = await embeddingProvider.generateEmbedding('Int8 storage test');
+
+      const documentId = await store.storeDocument('Int8 storage test', {}, 'encoding', embedding);
+
+      const storedDoc = await store.getDocument(documentId, true);
+      expect(storedDoc!.embedding).toHaveLength(embedding.length);
+      // Rounding to the nearest 1/127 step is off by at most half a step
+      storedDoc!.embedding.forEach((value, i) => {
+        expect(Math.abs(value - embedding[i])).toBeLessThanOrEqual(0.5 / 127 + 1e-9);
+      });
+    });
+
+    it('should read documents stored in the array format', async () => {
+      const store = await createStore('test_vector_float32', 'float32');
+      const embedding = await embeddingProvider.generateEmbedding('Legacy array document');
+      const { insertedId } = await mockConnection.getDb().collection('test_vector_float32').insertOne({
+        text: 'Legacy array document',
+        embedding,
+        metadata: {},
+        source: 'encoding',
+        timestamp: new Date()
+      });
+
+      const storedDoc = await store.getDocument(insertedId.toString(), true);
+      expect(storedDoc!.embedding).toEqual(embedding);
+    });
   });
 
   describe('Vector Search', () => {
@@ -255,6 +379,79 @@ describe('MongoVectorStore', () => {
     });
   });
 
+  describe('Hybrid Search Fusion', () => {
+    // Raw branch hits stand in for $vectorSearch/$search output, which needs Atlas
+    const vectorHits = [
+      { _id: 'a', rawScore: 0.9 },
+      { _id: 'b', rawScore: 0.8 },
+      { _id: 'c', rawScore: 0.5 }
+    ];
+    const textHits = [
+      { _id: 'c', rawScore: 12 },
+      { _id: 'd', rawScore: 4 },
+      { _id: 'a', rawScore: 2 }
+    ];
+
+    const fuse = async (fusionMethod: 'rrf' | 'rsf') => {
+      const db = mockConnection.getDb();
+      await db.collection('fusion_vector_hits').deleteMany({});
+      await db.collection('fusion_text_hits').deleteMany({});
+      await db.collection('fusion_vector_hits').insertMany(vectorHits as any[]);
+      await db.collection('fusion_text_hits').insertMany(textHits as any[]);
+
+      return db.collection('fusion_vector_hits').aggregate([
+        { $sort: { rawScore: -1 } },
+        ...fusionScoreStages(fusionMethod, 'vectorScore', 0.7),
+        {
+          $unionWith: {
+            coll: 'fusion_text_hits',
+            pipeline: [{ $sort: { rawScore: -1 } }, ...fusionScoreStages(fusionMethod, 'textScore', 0.3)]
+          }
+        },
+        ...fusionCombineStages()
+      ]).toArray();
+    };
+
+    it('should fuse branches by reciprocal rank', async () => {
+      const results = await fuse('rrf');
+
+      expect(results.map(result => result._id)).toEqual(['a', 'c', 'b', 'd']);
+      const byId = Object.fromEntries(results.map(result => [result._id, result]));
+      expect(byId.a.score).toBeCloseTo(0.7 / 61 + 0.3 / 63, 10);
+      expect(byId.c.score).toBeCloseTo(0.7 / 63 + 0.3 / 61, 10);
+      expect(byId.b.score).toBeCloseTo(0.7 / 62, 10);
+      expect(byId.d.score).toBeCloseTo(0.3 / 62, 10);
+      expect(byId.b.textScore).toBeNull();
+      expect(byId.d.vectorScore).toBeNull();
+    });
+
+    it('should fuse branches by min-max normalized score', async () => {
+      const results = await fuse('rsf');
+
+      expect(results.map(result => result._id)).toEqual(['a', 'b', 'c', 'd']);
+      const byId = Object.fromEntries(results.map(result => [result._id, result]));
+      // Each branch is rescaled to [0, 1] before weighting
+      expect(byId.a.vectorScore).toBeCloseTo(0.7, 10);
+      expect(byId.a.textScore).toBeCloseTo(0, 10);
+      expect(byId.b.score).toBeCloseTo(0.7 * 0.75, 10);
+      expect(byId.c.vectorScore).toBeCloseTo(0, 10);
+      expect(byId.c.score).toBeCloseTo(0.3, 10);
+      expect(byId.d.score).toBeCloseTo(0.3 * 0.2, 10);
+    });
+
+    it('should give a lone relative-score hit the full branch weight', async () => {
+      const db = mockConnection.getDb();
+      await db.collection('fusion_vector_hits').deleteMany({});
+      await db.collection('fusion_vector_hits').insertOne({ _id: 'only', rawScore: 0.42 } as any);
+
+      const [result] = await db.collection('fusion_vector_hits')
+        .aggregate(fusionScoreStages('rsf', 'vectorScore', 0.7))
+        .toArray();
+
+      expect(result).toEqual({ _id: 'only', vectorScore: 0.7 });
+    });
+  });
+
   describe('Document Management', () => {
     let testDocumentId: string;
 
@@ -334,6 +531,19 @@ describe('MongoVectorStore', () => {
       expect(typeof health.isHealthy).toBe('boolean');
     });
 
+    it('should report an embedding provider failure on every check', async () => {
+      await vectorStore.healthCheck();
+      const generate = jest.spyOn(embeddingProvider, 'generateEmbedding')
+        .mockRejectedValueOnce(new Error('Invalid API key'));
+
+      const health = await vectorStore.healthCheck();
+
+      expect(generate).toHaveBeenCalled();
+      expect(health.isHealthy).toBe(false);
+      expect(health.details.error).toBe('Invalid API key');
+      generate.mockRestore();
+    });
+
     it('should provide vector index definition', async () => {
       const indexDef = vectorStore.getVectorIndexDefinition(1536);
       
@@ -349,6 +559,27 @@ describe('MongoVectorStore', () => {
     });
   });
 
+  describe('Index Management', () => {
+    it('should not rebuild indexes that already exist', async () => {
+      const db = mockConnection.getDb();
+      const firstStore = new MongoVectorStore(mockConnection as any, 'test_index_collection', 'idx_vector', 'idx_text');
+      await firstStore.initialize(embeddingProvider);
+      const indexesAfterFirst = await db.collection('test_index_collection').indexes();
+
+      const secondStore = new MongoVectorStore(mockConnection as any, 'test_index_collection', 'idx_vector', 'idx_text');
+      const createIndexes = jest.spyOn((secondStore as any).collection, 'createIndexes');
+      await secondStore.initialize(embeddingProvider);
+
+      expect(createIndexes).not.toHaveBeenCalled();
+      const indexesAfterSecond = await db.collection('test_index_collection').indexes();
+      expect(indexesAfterSecond.map(index => index.name).sort())
+        .toEqual(indexesAfterFirst.map(index => index.name).sort());
+      expect(indexesAfterFirst.map(index => index.name)).toEqual(
+        expect.arrayContaining(['idx_text', 'source_1_timestamp_-1', 'metadata.type_1', 'timestamp_-1'])
+      );
+    });
+  });
+
   describe('Error Handling', () => {
     it('should handle invalid document IDs gracefully', async () => {
       const invalidDoc = await vectorStore.getDocument('invalid-id');
@@ -102,7 +102,19 @@ describe('Universal AI Brain Performance Benchmarks', () => {
       }
     ];
 
-    await db.collection('test_performance_collection').insertMany(knowledgeEntries);
+    // Upsert on content so reseeding an existing collection writes nothing
+    // for entries that are already there. Fixtures don't need majority
+    // durability, so acknowledge on the primary alone.
+    await db.collection('test_performance_collection').bulkWrite(
+      knowledgeEntries.map(entry => ({
+        updateOne: {
+          filter: { content: entry.content },
+          update: { $setOnInsert: entry },
+          upsert: true
+        }
+      })),
+      { ordered: false, writeConcern: { w: 1 } }
+    );
   }
 
   describe('Response Quality Enhancement Benchmarks', () => {
@@ -0,0 +1,11 @@
+import { MongoMemoryServer } from 'mongodb-memory-server';
+
+/**
+ * Start one in-memory MongoDB for the whole test run. Test files connect to it
+ * through MONGODB_TEST_URI instead of each booting (and tearing down) its own server.
+ */
+export default async function globalSetup(): Promise<void> {
+  const mongod = await MongoMemoryServer.create();
+  (globalThis as any).__MONGOD__ = mongod;
+  process.env.MONGODB_TEST_URI = mongod.getUri();
+}
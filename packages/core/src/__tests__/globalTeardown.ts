@@ -0,0 +1,11 @@
+import { MongoMemoryServer } from 'mongodb-memory-server';
+
+/**
+ * Stop the shared in-memory MongoDB started by globalSetup
+ */
+export default async function globalTeardown(): Promise<void> {
+  const mongod: MongoMemoryServer | undefined = (globalThis as any).__MONGOD__;
+  if (mongod) {
+    await mongod.stop();
+  }
+}
@@ -156,7 +156,8 @@ describe('EmotionalIntelligenceEngine', () => {
         }
       ];
 
-      for (const testContext of contexts) {
+      // Each context belongs to a different agent, so they can be processed concurrently
+      const responses = await Promise.all(contexts.map(async (testContext) => {
         const context = {
           agentId: testContext.agentId,
           sessionId: 'session-guidance',
@@ -165,15 +166,17 @@ describe('EmotionalIntelligenceEngine', () => {
         };
 
         const emotion = await emotionalEngine.detectEmotion(context);
-        const response = await emotionalEngine.processEmotionalState(
+        return emotionalEngine.processEmotionalState(
           context,
           emotion,
           'Test trigger',
           'user_input'
         );
+      }));
 
-        expect(response.emotionalGuidance).toMatchObject(testContext.expectedGuidance);
-      }
+      responses.forEach((response, index) => {
+        expect(response.emotionalGuidance).toMatchObject(contexts[index].expectedGuidance);
+      });
     });
   });
 
@@ -253,44 +256,48 @@ describe('EmotionalIntelligenceEngine', () => {
         { primary: 'joy', valence: 0.9, trigger: 'praise', triggerType: 'user_input' }
       ];
 
-      for (const emotion of emotions) {
-        const state = {
-          agentId,
-          timestamp: new Date(),
-          emotions: {
-            primary: emotion.primary,
-            intensity: 0.7,
-            valence: emotion.valence,
-            arousal: 0.5,
-            dominance: 0.5
-          },
-          context: {
-            trigger: emotion.trigger,
-            triggerType: emotion.triggerType as any,
-            conversationTurn: 1
-          },
-          cognitiveEffects: {
-            attentionModification: 0.1,
-            memoryStrength: 0.5,
-            decisionBias: 0.1,
-            responseStyle: 'analytical' as const
-          },
-          decay: {
-            halfLife: 30,
-            decayFunction: 'exponential' as const,
-            baselineReturn: 60
-          },
-          metadata: {
-            framework: 'test',
-            model: 'test-model',
-            confidence: 0.8,
-            source: 'detected' as const,
-            version: '1.0.0'
-          }
-        };
-        
-        await emotionalCollection.recordEmotionalState(state);
-      }
+      // Fields shared by every state, built once and reused per emotion
+      const stateTemplate = {
+        agentId,
+        cognitiveEffects: {
+          attentionModification: 0.1,
+          memoryStrength: 0.5,
+          decisionBias: 0.1,
+          responseStyle: 'analytical' as const
+        },
+        decay: {
+          halfLife: 30,
+          decayFunction: 'exponential' as const,
+          baselineReturn: 60
+        },
+        metadata: {
+          framework: 'test',
+          model: 'test-model',
+          confidence: 0.8,
+          source: 'detected' as const,
+          version: '1.0.0'
+        }
+      };
+
+      const states = emotions.map(emotion => ({
+        ...stateTemplate,
+        timestamp: new Date(),
+        emotions: {
+          primary: emotion.primary,
+          intensity: 0.7,
+          valence: emotion.valence,
+          arousal: 0.5,
+          dominance: 0.5
+        },
+        context: {
+          trigger: emotion.trigger,
+          triggerType: emotion.triggerType as any,
+          conversationTurn: 1
+        }
+      }));
+
+      const stateIds = await emotionalCollection.recordEmotionalStates(states);
+      expect(stateIds).toHaveLength(emotions.length);
 
       // Analyze patterns
       const patterns = await emotionalCollection.analyzeEmotionalPatterns(agentId, 1);
@@ -369,10 +376,33 @@ describe('EmotionalIntelligenceEngine', () => {
         { emotion: 'satisfaction', time: new Date() } // now
       ];
 
+      // Fields shared by every timeline state, built once and reused per item
+      const stateTemplate = {
+        agentId,
+        sessionId,
+        cognitiveEffects: {
+          attentionModification: 0.1,
+          memoryStrength: 0.5,
+          decisionBias: 0.0,
+          responseStyle: 'analytical' as const
+        },
+        decay: {
+          halfLife: 30,
+          decayFunction: 'exponential' as const,
+          baselineReturn: 60
+        },
+        metadata: {
+          framework: 'test',
+          model: 'test-model',
+          confidence: 0.8,
+          source: 'detected' as const,
+          version: '1.0.0'
+        }
+      };
+
       for (const item of timelineEmotions) {
         await emotionalCollection.recordEmotionalState({
-          agentId,
-          sessionId,
+          ...stateTemplate,
           timestamp: item.time,
           emotions: {
             primary: item.emotion,
@@ -385,24 +415,6 @@ describe('EmotionalIntelligenceEngine', () => {
             trigger: `Timeline event ${item.emotion}`,
             triggerType: 'user_input',
             conversationTurn: 1
-          },
-          cognitiveEffects: {
-            attentionModification: 0.1,
-            memoryStrength: 0.5,
-            decisionBias: 0.0,
-            responseStyle: 'analytical'
-          },
-          decay: {
-            halfLife: 30,
-            decayFunction: 'exponential',
-            baselineReturn: 60
-          },
-          metadata: {
-            framework: 'test',
-            model: 'test-model',
-            confidence: 0.8,
-            source: 'detected',
-            version: '1.0.0'
           }
         });
       }
@@ -6,6 +6,26 @@
 import { MongoClient, Db } from 'mongodb';
 import { VectorSearchEngine, SearchResult, SearchOptions, HybridSearchOptions } from '../../intelligence/VectorSearchEngine';
 import { setupTestDatabase, cleanupTestDatabase, shouldSkipTest, shouldSkipEmbeddingTest, createTestEmbeddingProvider, hasRealApiKeys } from '../testConfig';
+import { setupTestDb, teardownTestDb } from '../setup';
+import { EmbeddingProvider } from '../../vector/MongoVectorStore';
+
+// Deterministic embeddings so storage tests run without an API key
+class StubEmbeddingProvider implements EmbeddingProvider {
+  calls: string[] = [];
+
+  async generateEmbedding(text: string): Promise<number[]> {
+    this.calls.push(text);
+    return Array.from({ length: 8 }, (_, i) => Math.sin(text.length + i) / 3);
+  }
+
+  getDimensions(): number {
+    return 8;
+  }
+
+  getModel(): string {
+    return 'stub-embedding';
+  }
+}
 
 describe('VectorSearchEngine - Real MongoDB Atlas Integration', () => {
   let client: MongoClient;
@@ -379,3 +399,125 @@ with MongoDB Atlas and real embedding providers.
     });
   });
 });
+
+describe('VectorSearchEngine - Embedding Storage', () => {
+  let db: Db;
+
+  beforeAll(async () => {
+    db = await setupTestDb();
+  }, 60000);
+
+  afterAll(async () => {
+    await teardownTestDb();
+  });
+
+  // Search pipelines need Atlas, so read stored documents back through the
+  // same result mapping the searches use
+  const readBack = async (engine: VectorSearchEngine, collectionName: string, id: string): Promise<SearchResult> => {
+    const stored = await db.collection(collectionName).findOne({ _id: id as any });
+    return (engine as any).processSearchResults([stored], 'semantic', false)[0];
+  };
+
+  it('should round-trip float32 embeddings', async () => {
+    const provider = new StubEmbeddingProvider();
+    const engine = new VectorSearchEngine(db, provider, 'float32_vectors', 'vector_index', 'text_index', 'float32');
+
+    const id = await engine.storeDocument('Float32 storage test', { type: 'encoding' }, 'float32-doc');
+
+    const result = await readBack(engine, 'float32_vectors', id);
+    const expected = await provider.generateEmbedding('Float32 storage test');
+    expect(result.embedding).toEqual(Array.from(Float32Array.from(expected)));
+  });
+
+  it('should read documents stored in the array format', async () => {
+    const provider = new StubEmbeddingProvider();
+    const arrayEngine = new VectorSearchEngine(db, provider, 'mixed_vectors', 'vector_index', 'text_index', 'array');
+    const float32Engine = new VectorSearchEngine(db, provider, 'mixed_vectors', 'vector_index', 'text_index', 'float32');
+
+    const id = await arrayEngine.storeDocument('Array storage test', { type: 'encoding' }, 'array-doc');
+
+    const result = await readBack(float32Engine, 'mixed_vectors', id);
+    expect(result.embedding).toEqual(await provider.generateEmbedding('Array storage test'));
+  });
+});
+
+describe('VectorSearchEngine - Fallbacks', () => {
+  // Records every pipeline and answers from a callback, so fallbacks can be
+  // exercised without an Atlas deployment
+  class FakeCollection {
+    pipelines: any[][] = [];
+
+    constructor(private respond: (pipeline: any[]) => Promise<any[]>) {}
+
+    aggregate(pipeline: any[]) {
+      this.pipelines.push(pipeline);
+      return { toArray: () => this.respond(pipeline) };
+    }
+
+    async replaceOne() {
+      return { acknowledged: true, matchedCount: 0, modifiedCount: 0, upsertedCount: 1 };
+    }
+  }
+
+  const fakeDb = (collection: FakeCollection): Db => ({ collection: () => collection }) as unknown as Db;
+  const rankFusionCalls = (collection: FakeCollection) =>
+    collection.pipelines.filter(pipeline => pipeline[0].$rankFusion).length;
+
+  it('should not cache a failed embedding', async () => {
+    const provider = new StubEmbeddingProvider();
+    const generate = jest.spyOn(provider, 'generateEmbedding')
+      .mockRejectedValueOnce(new Error('rate limited'));
+    const engine = new VectorSearchEngine(fakeDb(new FakeCollection(async () => [])), provider);
+
+    await expect(engine.createEmbedding('retry me')).rejects.toThrow('rate limited');
+    await expect(engine.createEmbedding('retry me')).resolves.toHaveLength(8);
+    await engine.createEmbedding('retry me');
+
+    // The failure was retried once; the success was reused
+    expect(generate).toHaveBeenCalledTimes(2);
+  });
+
+  it('should invalidate cached results when a document is stored', async () => {
+    const collection = new FakeCollection(async () => [
+      { _id: 'doc-1', content: { text: 'Cached result' }, metadata: {}, vectorScore: 0.9 }
+    ]);
+    const engine = new VectorSearchEngine(fakeDb(collection), new StubEmbeddingProvider());
+
+    await engine.semanticSearch('cached query');
+    await engine.semanticSearch('cached query');
+    expect(collection.pipelines).toHaveLength(1);
+
+    await engine.storeDocument('New document', {}, 'doc-2');
+    await engine.semanticSearch('cached query');
+    expect(collection.pipelines).toHaveLength(2);
+  });
+
+  it('should stop trying $rankFusion after the server rejects the stage', async () => {
+    const unsupported = Object.assign(new Error("Unrecognized pipeline stage name: '$rankFusion'"), { code: 40324 });
+    const collection = new FakeCollection(async pipeline => {
+      if (pipeline[0].$rankFusion) throw unsupported;
+      return [];
+    });
+    const engine = new VectorSearchEngine(fakeDb(collection), new StubEmbeddingProvider());
+
+    await engine.hybridSearch('first query');
+    await engine.hybridSearch('second query');
+
+    expect(rankFusionCalls(collection)).toBe(1);
+    // Both searches still ran the semantic fallback
+    expect(collection.pipelines.filter(pipeline => pipeline[0].$vectorSearch)).toHaveLength(2);
+  });
+
+  it('should keep trying $rankFusion after other errors', async () => {
+    const collection = new FakeCollection(async pipeline => {
+      if (pipeline[0].$rankFusion) throw Object.assign(new Error('connection reset'), { code: 6 });
+      return [];
+    });
+    const engine = new VectorSearchEngine(fakeDb(collection), new StubEmbeddingProvider());
+
+    await engine.hybridSearch('first query');
+    await engine.hybridSearch('second query');
+
+    expect(rankFusionCalls(collection)).toBe(2);
+  });
+});
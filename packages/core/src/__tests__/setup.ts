@@ -1,28 +1,38 @@
 import { MongoMemoryServer } from 'mongodb-memory-server';
 import { MongoClient, Db } from 'mongodb';
 
-let mongod: MongoMemoryServer;
+let mongod: MongoMemoryServer | undefined;
 let client: MongoClient;
 let db: Db;
 
 export async function setupTestDb(): Promise<Db> {
-  mongod = await MongoMemoryServer.create();
-  const uri = mongod.getUri();
+  // Reuse the server started once by globalSetup; only boot a private one
+  // when the file is run outside the configured jest project
+  let uri = process.env.MONGODB_TEST_URI;
+  if (!uri) {
+    mongod = await MongoMemoryServer.create();
+    uri = mongod.getUri();
+  }
   client = new MongoClient(uri);
   await client.connect();
-  db = client.db('test_ai_agents');
+  // A database per test file keeps files isolated on the shared server
+  db = client.db(`test_ai_agents_${process.pid}_${Date.now()}`);
   return db;
 }
 
 export async function teardownTestDb(): Promise<void> {
   if (client) {
+    if (db) {
+      await db.dropDatabase();
+    }
     await client.close();
   }
   if (mongod) {
     await mongod.stop();
+    mongod = undefined;
   }
 }
 
 export function getTestDb(): Db {
   return db;
-}
\ No newline at end of file
+}
@@ -80,13 +80,14 @@ export async function cleanupTestDatabase(client?: MongoClient): Promise<void> {
 
   if (dbToClean) {
     try {
-      // Clean up test collections following MongoDB best practices
-      const collections = await dbToClean.listCollections().toArray();
-      for (const collection of collections) {
-        if (collection.name.includes('test') || collection.name.includes('temp')) {
-          await dbToClean.collection(collection.name).deleteMany({});
-        }
-      }
+      // Empty test collections concurrently; like jest.setup.ts, keep the
+      // collections themselves so indexes created in beforeAll survive
+      const collections = await dbToClean.listCollections({}, { nameOnly: true }).toArray();
+      await Promise.all(
+        collections
+          .filter(collection => collection.name.includes('test') || collection.name.includes('temp'))
+          .map(collection => dbToClean.collection(collection.name).deleteMany({}))
+      );
       console.log('🧹 Cleaned up test collections');
     } catch (error) {
       console.warn('⚠️ Warning: Could not clean up test collections:', error);
@@ -0,0 +1,74 @@
+/**
+ * @file concurrency.test.ts - Tests for bounded-concurrency mapping
+ */
+
+import { mapWithConcurrency } from '../../utils/concurrency';
+import { OpenAIEmbeddingProvider } from '../../embeddings/OpenAIEmbeddingProvider';
+
+const delay = (ms: number) => new Promise(resolve => setTimeout(resolve, ms));
+
+describe('mapWithConcurrency', () => {
+  it('should keep input order when later items finish first', async () => {
+    const delays = [30, 5, 20, 0, 10];
+
+    const results = await mapWithConcurrency(delays, 3, async (ms, index) => {
+      await delay(ms);
+      return index;
+    });
+
+    expect(results).toEqual([0, 1, 2, 3, 4]);
+  });
+
+  it('should never exceed the concurrency limit', async () => {
+    let inFlight = 0;
+    let peak = 0;
+
+    await mapWithConcurrency(Array.from({ length: 10 }, (_, i) => i), 3, async () => {
+      inFlight++;
+      peak = Math.max(peak, inFlight);
+      await delay(5);
+      inFlight--;
+    });
+
+    expect(peak).toBe(3);
+  });
+
+  it('should handle an empty list', async () => {
+    await expect(mapWithConcurrency([], 4, async item => item)).resolves.toEqual([]);
+  });
+
+  it('should reject a concurrency below 1', async () => {
+    await expect(mapWithConcurrency([1], 0, async item => item)).rejects.toThrow('positive integer');
+    await expect(mapWithConcurrency([1], NaN, async item => item)).rejects.toThrow('positive integer');
+  });
+});
+
+describe('OpenAIEmbeddingProvider batching', () => {
+  it('should return embeddings in input order with concurrent batches', async () => {
+    const provider = new OpenAIEmbeddingProvider({
+      apiKey: 'test-key-batching',
+      model: 'text-embedding-3-small',
+      batchSize: 2,
+      maxConcurrentBatches: 3
+    });
+    // Earlier batches answer last, so out-of-order completion would show up
+    jest.spyOn(provider as any, 'callEmbeddingAPI').mockImplementation(async (...args: unknown[]) => {
+      const texts = args[0] as string[];
+      await delay(40 - Number(texts[0]) * 5);
+      return texts.map(text => [Number(text)]);
+    });
+
+    const texts = Array.from({ length: 7 }, (_, i) => String(i));
+    const embeddings = await provider.generateEmbeddings(texts);
+
+    expect(embeddings).toEqual(texts.map(text => [Number(text)]));
+  });
+
+  it('should reject maxConcurrentBatches below 1', () => {
+    expect(() => new OpenAIEmbeddingProvider({
+      apiKey: 'test-key-batching',
+      model: 'text-embedding-3-small',
+      maxConcurrentBatches: 0
+    })).toThrow('maxConcurrentBatches');
+  });
+});
@@ -0,0 +1,77 @@
+/**
+ * @file promiseCache.test.ts - Tests for the bounded promise cache
+ */
+
+import { PromiseCache } from '../../utils/promiseCache';
+
+describe('PromiseCache', () => {
+  afterEach(() => {
+    jest.restoreAllMocks();
+  });
+
+  it('should share one load between concurrent callers', async () => {
+    const cache = new PromiseCache<string, number>(10);
+    const load = jest.fn(async () => 42);
+
+    const [first, second] = await Promise.all([cache.get('key', load), cache.get('key', load)]);
+
+    expect(first).toBe(42);
+    expect(second).toBe(42);
+    expect(load).toHaveBeenCalledTimes(1);
+  });
+
+  it('should evict the oldest entry once full', async () => {
+    const cache = new PromiseCache<string, string>(2);
+    const load = jest.fn(async () => 'value');
+
+    await cache.get('a', load);
+    await cache.get('b', load);
+    await cache.get('c', load);
+    expect(cache.size).toBe(2);
+
+    await cache.get('b', load);
+    await cache.get('c', load);
+    expect(load).toHaveBeenCalledTimes(3);
+
+    await cache.get('a', load);
+    expect(load).toHaveBeenCalledTimes(4);
+  });
+
+  it('should drop failed loads so the next call retries', async () => {
+    const cache = new PromiseCache<string, number>(10);
+    const load = jest.fn()
+      .mockRejectedValueOnce(new Error('unavailable'))
+      .mockResolvedValueOnce(7);
+
+    await expect(cache.get('key', load)).rejects.toThrow('unavailable');
+    await expect(cache.get('key', load)).resolves.toBe(7);
+    await expect(cache.get('key', load)).resolves.toBe(7);
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+
+  it('should treat a synchronous throw as a failed load', async () => {
+    const cache = new PromiseCache<string, number>(10);
+
+    await expect(cache.get('key', () => { throw new Error('bad input'); })).rejects.toThrow('bad input');
+    expect(cache.size).toBe(0);
+  });
+
+  it('should reload entries older than the TTL', async () => {
+    const now = jest.spyOn(Date, 'now').mockReturnValue(1000);
+    const cache = new PromiseCache<string, number>(10, 500);
+    const load = jest.fn(async () => 1);
+
+    await cache.get('key', load);
+    now.mockReturnValue(1500);
+    await cache.get('key', load);
+    expect(load).toHaveBeenCalledTimes(1);
+
+    now.mockReturnValue(1501);
+    await cache.get('key', load);
+    expect(load).toHaveBeenCalledTimes(2);
+  });
+
+  it('should reject a size below 1', () => {
+    expect(() => new PromiseCache(0)).toThrow('at least 1');
+  });
+});
@@ -0,0 +1,51 @@
+/**
+ * @file topK.test.ts - Tests for bounded top-k selection
+ */
+
+import { topK } from '../../utils/topK';
+
+describe('topK', () => {
+  const identity = (value: number) => value;
+
+  it('should return nothing for k <= 0', () => {
+    expect(topK([3, 1, 2], 0, identity)).toEqual([]);
+    expect(topK([3, 1, 2], -1, identity)).toEqual([]);
+  });
+
+  it('should return every item when k exceeds the input size', () => {
+    expect(topK([2, 5, 1], 10, identity)).toEqual([5, 2, 1]);
+    expect(topK([], 3, identity)).toEqual([]);
+  });
+
+  it('should return the k highest scores in descending order', () => {
+    const values = [7, 3, 9, 1, 8, 2, 6, 4, 5, 0];
+    expect(topK(values, 3, identity)).toEqual([9, 8, 7]);
+    expect(topK(values, values.length, identity)).toEqual([9, 8, 7, 6, 5, 4, 3, 2, 1, 0]);
+  });
+
+  it('should keep tied items in input order', () => {
+    const items = [
+      { id: 'a', score: 0.5 },
+      { id: 'b', score: 0.9 },
+      { id: 'c', score: 0.5 },
+      { id: 'd', score: 0.1 },
+      { id: 'e', score: 0.5 }
+    ];
+
+    expect(topK(items, 3, item => item.score).map(item => item.id)).toEqual(['b', 'a', 'c']);
+    expect(topK(items, 4, item => item.score).map(item => item.id)).toEqual(['b', 'a', 'c', 'e']);
+    expect(topK(items, 5, item => item.score).map(item => item.id)).toEqual(['b', 'a', 'c', 'e', 'd']);
+  });
+
+  it('should match a stable sort on heavily tied scores', () => {
+    const items = Array.from({ length: 20 }, (_, i) => ({ id: i, score: i % 3 }));
+    const expected = [...items].sort((a, b) => b.score - a.score).slice(0, 8);
+
+    expect(topK(items, 8, item => item.score)).toEqual(expected);
+  });
+
+  it('should accept any iterable', () => {
+    const scores = new Map([['x', 2], ['y', 3], ['z', 1]]);
+    expect(topK(scores.keys(), 2, key => scores.get(key)!)).toEqual(['y', 'x']);
+  });
+});
@@ -0,0 +1,23 @@
+/**
+ * @file vectorSearch.test.ts - Tests for $vectorSearch candidate pool sizing
+ */
+
+import { numCandidatesFor } from '../../utils/vectorSearch';
+
+describe('numCandidatesFor', () => {
+  it('should never go below the candidate floor', () => {
+    expect(numCandidatesFor(0)).toBe(20);
+    expect(numCandidatesFor(1)).toBe(20);
+  });
+
+  it('should scale at 15 candidates per requested result', () => {
+    expect(numCandidatesFor(2)).toBe(30);
+    expect(numCandidatesFor(10)).toBe(150);
+    expect(numCandidatesFor(100)).toBe(1500);
+  });
+
+  it('should cap at the $vectorSearch maximum', () => {
+    expect(numCandidatesFor(667)).toBe(10000);
+    expect(numCandidatesFor(5000)).toBe(10000);
+  });
+});
@@ -0,0 +1,54 @@
+/**
+ * @file version.test.ts - Tests for minimum-version checks
+ */
+
+import { parseVersion, isVersionAtLeast } from '../../utils/version';
+
+describe('parseVersion', () => {
+  it('should parse a full version', () => {
+    expect(parseVersion('8.1.0')).toEqual([8, 1, 0]);
+  });
+
+  it('should pad missing segments with zeros and ignore extra ones', () => {
+    expect(parseVersion('8')).toEqual([8, 0, 0]);
+    expect(parseVersion('8.1')).toEqual([8, 1, 0]);
+    expect(parseVersion('8.1.2.3')).toEqual([8, 1, 2]);
+  });
+
+  it('should drop pre-release suffixes', () => {
+    expect(parseVersion('8.0.4-rc1')).toEqual([8, 0, 4]);
+    expect(parseVersion('1.2.0-beta.3')).toEqual([1, 2, 0]);
+  });
+});
+
+describe('isVersionAtLeast', () => {
+  it('should compare segment by segment', () => {
+    expect(isVersionAtLeast('8.1.0', [8, 1, 0])).toBe(true);
+    expect(isVersionAtLeast('8.2.0', [8, 1, 5])).toBe(true);
+    expect(isVersionAtLeast('9.0.0', [8, 1, 0])).toBe(true);
+    expect(isVersionAtLeast('8.0.9', [8, 1, 0])).toBe(false);
+    expect(isVersionAtLeast('7.9.9', [8, 0, 0])).toBe(false);
+  });
+
+  it('should accept a later minor with a lower patch', () => {
+    // The old OpenAI Agents check required patch >= 1 at every minor
+    expect(isVersionAtLeast('0.1.0', [0, 0, 1])).toBe(true);
+    expect(isVersionAtLeast('0.0.0', [0, 0, 1])).toBe(false);
+  });
+
+  it('should treat missing segments as zero', () => {
+    expect(isVersionAtLeast('8.1', [8, 1, 0])).toBe(true);
+    expect(isVersionAtLeast('8', [8, 1, 0])).toBe(false);
+    expect(isVersionAtLeast('3', [3, 0, 0])).toBe(true);
+  });
+
+  it('should compare pre-releases as their release version', () => {
+    expect(isVersionAtLeast('8.1.0-rc0', [8, 1, 0])).toBe(true);
+    expect(isVersionAtLeast('8.0.4-rc1', [8, 1, 0])).toBe(false);
+  });
+
+  it('should accept parsed tuples', () => {
+    expect(isVersionAtLeast([8, 1, 0], [8, 1, 0])).toBe(true);
+    expect(isVersionAtLeast([8, 0, 12], [8, 1, 0])).toBe(false);
+  });
+});
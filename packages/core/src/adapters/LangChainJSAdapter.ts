@@ -9,6 +9,7 @@
 import { BaseFrameworkAdapter } from './BaseFrameworkAdapter';
 import { UniversalAIBrain } from '../UniversalAIBrain';
 import { FrameworkAdapter, FrameworkCapabilities, AdapterConfig } from '../types';
+import { isVersionAtLeast } from '../utils/version';
 
 // LangChain.js types (will be imported from @langchain/core when available)
 interface LangChainMessage {
@@ -360,8 +361,7 @@ export class LangChainJSAdapter extends BaseFrameworkAdapter<any> {
       const version = packageJson.version;
 
       // Check if version is 0.1.0 or higher (based on docs)
-      const [major, minor] = version.split('.').map(Number);
-      if (major > 0 || (major === 0 && minor >= 1)) {
+      if (isVersionAtLeast(version, [0, 1, 0])) {
         return true;
       }
 
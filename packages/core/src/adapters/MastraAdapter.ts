@@ -9,6 +9,7 @@
 import { BaseFrameworkAdapter } from './BaseFrameworkAdapter';
 import { UniversalAIBrain } from '../UniversalAIBrain';
 import { FrameworkAdapter, FrameworkCapabilities, AdapterConfig } from '../types';
+import { isVersionAtLeast } from '../utils/version';
 
 // Mastra framework types (will be imported from @mastra/core when available)
 interface MastraAgent {
@@ -261,8 +262,7 @@ export class MastraAdapter extends BaseFrameworkAdapter<MastraAgent> {
       const version = packageJson.version;
 
       // Check if version is 0.10.0 or higher (based on docs)
-      const [major, minor] = version.split('.').map(Number);
-      if (major > 0 || (major === 0 && minor >= 10)) {
+      if (isVersionAtLeast(version, [0, 10, 0])) {
         return true;
       }
 
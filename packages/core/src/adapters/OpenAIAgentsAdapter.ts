@@ -9,6 +9,7 @@
 import { BaseFrameworkAdapter } from './BaseFrameworkAdapter';
 import { UniversalAIBrain } from '../UniversalAIBrain';
 import { FrameworkAdapter, FrameworkCapabilities, AdapterConfig } from '../types';
+import { isVersionAtLeast } from '../utils/version';
 
 // OpenAI types (using official OpenAI Node.js client)
 import OpenAI from 'openai';
@@ -400,8 +401,7 @@ export class OpenAIAgentsAdapter extends BaseFrameworkAdapter<any> {
       const version = packageJson.version;
 
       // Check if version is 0.0.1 or higher (based on docs)
-      const [major, minor, patch] = version.split('.').map(Number);
-      if (major > 0 || (major === 0 && minor >= 0 && patch >= 1)) {
+      if (isVersionAtLeast(version, [0, 0, 1])) {
         return true;
       }
 
@@ -11,6 +11,7 @@ import { UniversalAIBrain } from '../UniversalAIBrain';
 import { ObjectId } from 'mongodb';
 import { FrameworkAdapter, FrameworkCapabilities, AdapterConfig } from '../types';
 import { TracingEngine, TracingUtils, FrameworkMetadata } from '../tracing';
+import { isVersionAtLeast } from '../utils/version';
 
 // Vercel AI SDK types (will be imported from 'ai' when available)
 interface AISDKMessage {
@@ -802,8 +803,7 @@ export class VercelAIAdapter extends BaseFrameworkAdapter<any> {
       const version = packageJson.version;
 
       // Check if version is 3.0.0 or higher (based on docs)
-      const majorVersion = parseInt(version.split('.')[0]);
-      if (majorVersion >= 3) {
+      if (isVersionAtLeast(version, [3, 0, 0])) {
         return true;
       }
 
@@ -200,7 +200,7 @@ export abstract class BaseCollection<T extends BaseDocument> {
       await this.validateDocument(doc);
     }
 
-    const result = await this.collection.insertMany(docsWithTimestamps as any);
+    const result = await this.collection.insertMany(docsWithTimestamps as any, { ordered: false });
     
     if (!result.acknowledged) {
       throw new Error(`Failed to insert documents into ${this.collectionName}`);
@@ -179,20 +179,36 @@ export class EmotionalStateCollection extends BaseCollection<EmotionalState> {
    * Record a new emotional state with automatic decay calculation
    */
   async recordEmotionalState(emotionalState: Omit<EmotionalState, '_id' | 'createdAt' | 'updatedAt'>): Promise<ObjectId> {
-    // Calculate expiration time based on decay parameters
-    const expiresAt = new Date(
-      Date.now() + (emotionalState.decay.baselineReturn * 60 * 1000)
+    const result = await this.collection.insertOne(this.withExpiry(emotionalState));
+    return result.insertedId;
+  }
+
+  /**
+   * Record multiple emotional states in a single round trip
+   */
+  async recordEmotionalStates(emotionalStates: Array<Omit<EmotionalState, '_id' | 'createdAt' | 'updatedAt'>>): Promise<ObjectId[]> {
+    if (emotionalStates.length === 0) {
+      return [];
+    }
+
+    const result = await this.collection.insertMany(
+      emotionalStates.map(state => this.withExpiry(state)),
+      { ordered: false }
     );
+    return Object.values(result.insertedIds);
+  }
 
-    const stateWithExpiry = {
+  /**
+   * Add expiration (based on decay parameters) and timestamps to an emotional state
+   */
+  private withExpiry(emotionalState: Omit<EmotionalState, '_id' | 'createdAt' | 'updatedAt'>): EmotionalState {
+    const now = new Date();
+    return {
       ...emotionalState,
-      expiresAt,
-      createdAt: new Date(),
-      updatedAt: new Date()
+      expiresAt: new Date(now.getTime() + (emotionalState.decay.baselineReturn * 60 * 1000)),
+      createdAt: now,
+      updatedAt: now
     };
-
-    const result = await this.collection.insertOne(stateWithExpiry);
-    return result.insertedId;
   }
 
   /**
@@ -263,37 +279,8 @@ export class EmotionalStateCollection extends BaseCollection<EmotionalState> {
   }> {
     const startDate = new Date(Date.now() - (days * 24 * 60 * 60 * 1000));
 
-    // Dominant emotions analysis
-    const dominantEmotions = await this.collection.aggregate([
-      {
-        $match: {
-          agentId,
-          timestamp: { $gte: startDate }
-        }
-      },
-      {
-        $group: {
-          _id: '$emotions.primary',
-          frequency: { $sum: 1 },
-          avgIntensity: { $avg: '$emotions.intensity' },
-          totalIntensity: { $sum: '$emotions.intensity' }
-        }
-      },
-      {
-        $sort: { totalIntensity: -1 }
-      },
-      {
-        $project: {
-          emotion: '$_id',
-          frequency: 1,
-          avgIntensity: { $round: ['$avgIntensity', 3] },
-          _id: 0
-        }
-      }
-    ]).toArray();
-
-    // Emotional stability (variance in valence)
-    const stabilityResult = await this.collection.aggregate([
+    // One $match + $facet pass instead of four aggregations over the same window
+    const [analysis] = await this.collection.aggregate([
       {
         $match: {
           agentId,
@@ -301,88 +288,106 @@ export class EmotionalStateCollection extends BaseCollection<EmotionalState> {
         }
       },
       {
-        $group: {
-          _id: null,
-          avgValence: { $avg: '$emotions.valence' },
-          valenceValues: { $push: '$emotions.valence' }
-        }
-      },
-      {
-        $project: {
-          stability: {
-            $subtract: [
-              1,
-              {
-                $divide: [
-                  {
-                    $stdDevPop: '$valenceValues'
-                  },
-                  2 // Max possible std dev for valence range [-1, 1]
-                ]
+        $facet: {
+          // Dominant emotions analysis
+          dominantEmotions: [
+            {
+              $group: {
+                _id: '$emotions.primary',
+                frequency: { $sum: 1 },
+                avgIntensity: { $avg: '$emotions.intensity' },
+                totalIntensity: { $sum: '$emotions.intensity' }
               }
-            ]
-          }
-        }
-      }
-    ]).toArray();
-
-    const emotionalStability = stabilityResult[0]?.stability || 0;
-
-    // Trigger analysis
-    const triggerAnalysis = await this.collection.aggregate([
-      {
-        $match: {
-          agentId,
-          timestamp: { $gte: startDate }
-        }
-      },
-      {
-        $group: {
-          _id: '$context.triggerType',
-          frequency: { $sum: 1 },
-          avgValence: { $avg: '$emotions.valence' }
-        }
-      },
-      {
-        $project: {
-          trigger: '$_id',
-          frequency: 1,
-          avgValence: { $round: ['$avgValence', 3] },
-          _id: 0
+            },
+            {
+              $sort: { totalIntensity: -1 }
+            },
+            {
+              $project: {
+                emotion: '$_id',
+                frequency: 1,
+                avgIntensity: { $round: ['$avgIntensity', 3] },
+                _id: 0
+              }
+            }
+          ],
+          // Emotional stability (variance in valence)
+          stability: [
+            {
+              $group: {
+                _id: null,
+                avgValence: { $avg: '$emotions.valence' },
+                valenceValues: { $push: '$emotions.valence' }
+              }
+            },
+            {
+              $project: {
+                stability: {
+                  $subtract: [
+                    1,
+                    {
+                      $divide: [
+                        {
+                          $stdDevPop: '$valenceValues'
+                        },
+                        2 // Max possible std dev for valence range [-1, 1]
+                      ]
+                    }
+                  ]
+                }
+              }
+            }
+          ],
+          // Trigger analysis
+          triggerAnalysis: [
+            {
+              $group: {
+                _id: '$context.triggerType',
+                frequency: { $sum: 1 },
+                avgValence: { $avg: '$emotions.valence' }
+              }
+            },
+            {
+              $project: {
+                trigger: '$_id',
+                frequency: 1,
+                avgValence: { $round: ['$avgValence', 3] },
+                _id: 0
+              }
+            },
+            {
+              $sort: { frequency: -1 }
+            }
+          ],
+          // Temporal patterns (by hour of day)
+          temporalPatterns: [
+            {
+              $group: {
+                _id: { $hour: '$timestamp' },
+                avgValence: { $avg: '$emotions.valence' },
+                avgArousal: { $avg: '$emotions.arousal' }
+              }
+            },
+            {
+              $project: {
+                hour: '$_id',
+                avgValence: { $round: ['$avgValence', 3] },
+                avgArousal: { $round: ['$avgArousal', 3] },
+                _id: 0
+              }
+            },
+            {
+              $sort: { hour: 1 }
+            }
+          ]
         }
-      },
-      {
-        $sort: { frequency: -1 }
       }
     ]).toArray();
 
-    // Temporal patterns (by hour of day)
-    const temporalPatterns = await this.collection.aggregate([
-      {
-        $match: {
-          agentId,
-          timestamp: { $gte: startDate }
-        }
-      },
-      {
-        $group: {
-          _id: { $hour: '$timestamp' },
-          avgValence: { $avg: '$emotions.valence' },
-          avgArousal: { $avg: '$emotions.arousal' }
-        }
-      },
-      {
-        $project: {
-          hour: '$_id',
-          avgValence: { $round: ['$avgValence', 3] },
-          avgArousal: { $round: ['$avgArousal', 3] },
-          _id: 0
-        }
-      },
-      {
-        $sort: { hour: 1 }
-      }
-    ]).toArray();
+    const dominantEmotions = analysis?.dominantEmotions || [];
+    const emotionalStability = analysis?.stability[0]?.stability || 0;
+    const triggerAnalysis = analysis?.triggerAnalysis || [];
+    const temporalPatterns = analysis?.temporalPatterns || [];
 
     return {
       dominantEmotions: dominantEmotions as Array<{ emotion: string; frequency: number; avgIntensity: number }>,
@@ -86,7 +86,7 @@ export class MetricsCollection extends BaseCollection<AgentPerformanceMetrics> {
       await this.validateDocument(metric);
     }
 
-    const result = await this.collection.insertMany(metrics);
+    const result = await this.collection.insertMany(metrics, { ordered: false });
     
     if (!result.acknowledged) {
       throw new Error('Failed to record metrics');
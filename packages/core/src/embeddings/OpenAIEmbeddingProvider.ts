@@ -7,6 +7,7 @@
  */
 
 import { EmbeddingProvider } from '../vector/MongoVectorStore';
+import { mapWithConcurrency } from '../utils/concurrency';
 
 export interface OpenAIConfig {
   apiKey: string;
@@ -15,6 +16,7 @@ export interface OpenAIConfig {
   maxRetries?: number;
   timeout?: number;
   batchSize?: number;
+  maxConcurrentBatches?: number;
 }
 
 export interface EmbeddingResponse {
@@ -51,6 +53,7 @@ export class OpenAIEmbeddingProvider implements EmbeddingProvider {
       maxRetries: 3,
       timeout: 30000,
       batchSize: 100,
+      maxConcurrentBatches: 4,
       baseUrl: 'https://api.openai.com/v1',
       ...config
     };
@@ -153,15 +156,19 @@ export class OpenAIEmbeddingProvider implements EmbeddingProvider {
   // Private methods
 
   private async processBatches(texts: string[]): Promise<number[][]> {
-    const results: number[][] = [];
-    
+    const batches: string[][] = [];
     for (let i = 0; i < texts.length; i += this.config.batchSize) {
-      const batch = texts.slice(i, i + this.config.batchSize);
-      const batchResults = await this.callEmbeddingAPI(batch);
-      results.push(...batchResults);
+      batches.push(texts.slice(i, i + this.config.batchSize));
     }
 
-    return results;
+    // Keep a few batch requests in flight; results come back in batch order
+    const results = await mapWithConcurrency(
+      batches,
+      this.config.maxConcurrentBatches,
+      batch => this.callEmbeddingAPI(batch)
+    );
+
+    return results.flat();
   }
 
   private async callEmbeddingAPI(texts: string[]): Promise<number[][]> {
@@ -251,6 +258,10 @@ export class OpenAIEmbeddingProvider implements EmbeddingProvider {
       throw new Error('OpenAI API key is required');
     }
 
+    if (!Number.isInteger(this.config.maxConcurrentBatches) || this.config.maxConcurrentBatches < 1) {
+      throw new Error('maxConcurrentBatches must be a positive integer');
+    }
+
     // Allow test keys for testing - check this FIRST
     if (this.config.apiKey.startsWith('test-key-')) {
       console.log('🧪 Using test API key for testing');
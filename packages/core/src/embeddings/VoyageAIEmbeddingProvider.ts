@@ -7,6 +7,7 @@
  */
 
 import { EmbeddingProvider } from '../vector/MongoVectorStore';
+import { mapWithConcurrency } from '../utils/concurrency';
 
 export interface VoyageAIConfig {
   apiKey: string;
@@ -15,6 +16,7 @@ export interface VoyageAIConfig {
   maxRetries?: number;
   timeout?: number;
   batchSize?: number;
+  maxConcurrentBatches?: number;
   inputType?: 'query' | 'document' | null;
   outputDimension?: number;
   outputDtype?: 'float' | 'int8' | 'uint8' | 'binary' | 'ubinary';
@@ -54,6 +56,7 @@ export class VoyageAIEmbeddingProvider implements EmbeddingProvider {
       maxRetries: 3,
       timeout: 30000,
       batchSize: 128, // Voyage AI supports up to 1000, but 128 is more conservative
+      maxConcurrentBatches: 4,
       baseUrl: 'https://api.voyageai.com/v1',
       inputType: null,
       outputDimension: undefined, // Use model default - will be set by model dimensions
@@ -160,15 +163,19 @@ export class VoyageAIEmbeddingProvider implements EmbeddingProvider {
    * Process texts in batches
    */
   private async processBatches(texts: string[]): Promise<number[][]> {
-    const results: number[][] = [];
-    
+    const batches: string[][] = [];
     for (let i = 0; i < texts.length; i += this.config.batchSize) {
-      const batch = texts.slice(i, i + this.config.batchSize);
-      const batchResults = await this.callVoyageAPI(batch);
-      results.push(...batchResults);
+      batches.push(texts.slice(i, i + this.config.batchSize));
     }
 
-    return results;
+    // Keep a few batch requests in flight; results come back in batch order
+    const results = await mapWithConcurrency(
+      batches,
+      this.config.maxConcurrentBatches,
+      batch => this.callVoyageAPI(batch)
+    );
+
+    return results.flat();
   }
 
   /**
@@ -295,6 +302,10 @@ export class VoyageAIEmbeddingProvider implements EmbeddingProvider {
       throw new Error('Voyage AI API key is required');
     }
 
+    if (!Number.isInteger(this.config.maxConcurrentBatches) || this.config.maxConcurrentBatches < 1) {
+      throw new Error('maxConcurrentBatches must be a positive integer');
+    }
+
     if (!this.config.model) {
       throw new Error('Voyage AI model is required');
     }
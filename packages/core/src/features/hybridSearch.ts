@@ -24,22 +24,73 @@ import { Collection, Db, Document } from 'mongodb';
 import { MongoEmbeddingProvider } from '../persistance/MongoEmbeddingProvider';
 import { OpenAIEmbeddingProvider } from '../embeddings/OpenAIEmbeddingProvider';
 import { VoyageAIEmbeddingProvider } from '../embeddings/VoyageAIEmbeddingProvider';
+import { isVersionAtLeast, parseVersion, VersionTuple } from '../utils/version';
+import { topK } from '../utils/topK';
+import { numCandidatesFor } from '../utils/vectorSearch';
+import { TEXT_SEARCH_PATHS } from '../utils/search';
+import { PromiseCache } from '../utils/promiseCache';
+
+// Minimum MongoDB server version for each search feature
+const MONGODB_FEATURE_MIN_VERSIONS = {
+  rankFusion: [8, 1, 0] as VersionTuple
+};
+
+type MongoDBFeature = keyof typeof MONGODB_FEATURE_MIN_VERSIONS;
+
+// Detected server version with every feature flag derived from it
+interface MongoDBServerInfo {
+  version: string;
+  features: Record<MongoDBFeature, boolean>;
+}
 
 // Embedding provider interface for flexibility
 export interface HybridSearchEmbeddingProvider {
   generateEmbedding(text: string): Promise<number[]>;
 }
 
+const DEFAULT_EMBEDDING_DIMENSIONS = 1536;
+
+// sin(i) and cos(i) for every dimension, computed once. The mock embedding is
+// sin(hash + i), which by angle addition is sin(hash)cos(i) + cos(hash)sin(i),
+// so each call needs two trig evaluations instead of one per dimension.
+const SIN_BY_DIMENSION = new Float64Array(DEFAULT_EMBEDDING_DIMENSIONS);
+const COS_BY_DIMENSION = new Float64Array(DEFAULT_EMBEDDING_DIMENSIONS);
+for (let i = 0; i < DEFAULT_EMBEDDING_DIMENSIONS; i++) {
+  SIN_BY_DIMENSION[i] = Math.sin(i);
+  COS_BY_DIMENSION[i] = Math.cos(i);
+}
+
 // Fallback embedding provider (mock implementation for development/testing)
 export class DefaultEmbeddingProvider implements HybridSearchEmbeddingProvider {
   async generateEmbedding(text: string): Promise<number[]> {
     console.warn(`Using fallback mock embedding provider for: ${text.substring(0, 50)}...`);
     console.warn('WARNING: This is a mock implementation. For production, configure a real embedding provider.');
-    // Mock implementation - generates consistent but meaningless embeddings
-    return Array(1536).fill(0).map(() => Math.random() * 2 - 1); // Random values between -1 and 1
+    // Mock implementation - generates consistent but meaningless embeddings:
+    // the text's hash seeds a sine wave filled in one pass over a typed array
+    let hash = 0;
+    for (let i = 0; i < text.length; i++) {
+      hash = (((hash << 5) - hash) + text.charCodeAt(i)) | 0;
+    }
+
+    const sinHash = Math.sin(hash);
+    const cosHash = Math.cos(hash);
+    const embedding = new Float64Array(DEFAULT_EMBEDDING_DIMENSIONS);
+    for (let i = 0; i < embedding.length; i++) {
+      // Equals Math.sin(hash + i): values between -1 and 1
+      embedding[i] = sinHash * COS_BY_DIMENSION[i] + cosHash * SIN_BY_DIMENSION[i];
+    }
+    return Array.from(embedding);
   }
 }
 
+// Per-document fusion state for the manual hybrid search
+interface FusedHit {
+  doc: Document;
+  vectorScore: number;
+  textScore: number;
+  combinedScore: number;
+}
+
 // Search result interface
 export interface HybridSearchResult {
   _id: string;
@@ -86,6 +137,7 @@ export class HybridSearchEngine {
   private db: Db;
   private embeddingProvider: HybridSearchEmbeddingProvider;
   private embeddingStore: MongoEmbeddingProvider<Document>;
+  private versionCache: PromiseCache<'serverInfo', MongoDBServerInfo> = new PromiseCache(1, 10 * 60 * 1000); // 10 minutes
 
   constructor(
     db: Db,
@@ -117,15 +169,19 @@ export class HybridSearchEngine {
     } = options;
 
     try {
-      // Generate query embedding
-      const queryEmbedding = await this.embeddingProvider.generateEmbedding(query);
+      // Generate query embedding and check MongoDB version concurrently -
+      // the two round trips are independent of each other
+      const [queryEmbedding, serverInfo] = await Promise.all([
+        this.embeddingProvider.generateEmbedding(query),
+        this.getMongoDBServerInfo()
+      ]);
+      const mongoVersion = serverInfo.version;
 
       // Build filter conditions
       const filterConditions = this.buildFilterConditions(filters);
 
-      // Check MongoDB version and use appropriate hybrid search method
-      const mongoVersion = await this.getMongoDBVersion();
-      const supportsRankFusion = this.isRankFusionSupported(mongoVersion);
+      // Use the appropriate hybrid search method for this MongoDB version
+      const supportsRankFusion = serverInfo.features.rankFusion;
 
       let results: HybridSearchResult[];
 
@@ -181,98 +237,89 @@ export class HybridSearchEngine {
     options: Required<SearchOptions>
   ): Promise<HybridSearchResult[]> {
     const collection = this.db.collection('vector_embeddings');
-
-    const pipeline: any[] = [
-      // Stage 1: Vector similarity search
-      {
-        $vectorSearch: {
-          index: options.vector_index,
-          queryVector: queryEmbedding,
-          path: 'embedding.values',
-          numCandidates: Math.max(options.limit * 10, 150),
-          limit: Math.max(options.limit * 2, 50),
-          filter: filterConditions,
-        },
-      },
-      {
-        $addFields: {
-          vector_score: { $meta: 'vectorSearchScore' },
-        },
-      },
-      // Stage 2: Text search (if text index exists)
-      {
-        $search: {
-          index: options.text_index,
-          compound: {
-            must: [
-              {
-                text: {
-                  query: query,
-                  path: ['content.text', 'content.summary'],
-                },
-              },
-            ],
-            filter: [filterConditions],
+    const candidateLimit = Math.max(options.limit * 2, 50);
+    const resultProjection = {
+      _id: 1,
+      embedding_id: 1,
+      content: 1,
+      metadata: 1,
+      ...(options.include_embeddings && { 'embedding.values': 1 })
+    };
+
+    // $vectorSearch and $search must each be the first stage of their own
+    // pipeline. They share no data, so run both aggregations concurrently
+    // and pay for the slower one instead of both.
+    const [vectorResults, textResults] = await Promise.all([
+      collection.aggregate([
+        {
+          $vectorSearch: {
+            index: options.vector_index,
+            queryVector: queryEmbedding,
+            path: 'embedding.values',
+            numCandidates: Math.max(numCandidatesFor(options.limit), candidateLimit),
+            limit: candidateLimit,
+            filter: filterConditions,
           },
         },
-      },
-      {
-        $addFields: {
-          text_score: { $meta: 'searchScore' },
-        },
-      },
-      // Stage 3: Combine scores with weights
-      {
-        $addFields: {
-          combined_score: {
-            $add: [
-              { $multiply: ['$vector_score', options.vector_weight] },
-              { $multiply: ['$text_score', options.text_weight] },
-            ],
+        { $project: { ...resultProjection, vector_score: { $meta: 'vectorSearchScore' } } }
+      ]).toArray(),
+      collection.aggregate([
+        {
+          $search: {
+            index: options.text_index,
+            compound: {
+              must: [
+                {
+                  text: {
+                    query: query,
+                    path: TEXT_SEARCH_PATHS,
+                  },
+                },
+              ],
+              filter: [filterConditions],
+            },
           },
         },
-      },
-      // Stage 4: Sort by combined score
-      { $sort: { combined_score: -1 } },
-      // Stage 5: Limit results
-      { $limit: options.limit },
-      // Stage 6: Project final results
-      {
-        $project: {
-          _id: 1,
-          embedding_id: 1,
-          content: 1,
-          metadata: 1,
-          vector_score: 1,
-          text_score: 1,
-          combined_score: 1,
-          ...(options.include_embeddings && { 'embedding.values': 1 }),
-          ...(options.explain_relevance && {
-            relevance_explanation: {
-              $concat: [
-                'Vector similarity: ', { $toString: { $round: ['$vector_score', 3] } },
-                ', Text relevance: ', { $toString: { $round: ['$text_score', 3] } },
-                ', Combined score: ', { $toString: { $round: ['$combined_score', 3] } }
-              ]
-            }
-          })
-        },
-      },
+        { $limit: candidateLimit },
+        { $project: { ...resultProjection, text_score: { $meta: 'searchScore' } } }
+      ]).toArray()
+    ]);
+
+    // Merge both result lists in one pass; documents found by both searches keep both scores.
+    // Entries reference the fetched document rather than copying its fields.
+    const combined = new Map<string, FusedHit>();
+    const branches: Array<[Document[], 'vectorScore' | 'textScore', 'vector_score' | 'text_score']> = [
+      [vectorResults, 'vectorScore', 'vector_score'],
+      [textResults, 'textScore', 'text_score']
     ];
+    for (const [docs, scoreKey, scoreField] of branches) {
+      for (const doc of docs) {
+        const id = doc._id.toString();
+        let entry = combined.get(id);
+        if (!entry) {
+          entry = { doc, vectorScore: 0, textScore: 0, combinedScore: 0 };
+          combined.set(id, entry);
+        }
+        entry[scoreKey] = doc[scoreField] || 0;
+        entry.combinedScore = entry.vectorScore * options.vector_weight + entry.textScore * options.text_weight;
+      }
+    }
 
-    const results = await collection.aggregate(pipeline).toArray();
-    
-    return results.map(doc => ({
+    // Only the page is returned, so select it without sorting every candidate
+    // and build result objects for the selected documents alone
+    return topK(combined.values(), options.limit, entry => entry.combinedScore).map(({ doc, vectorScore, textScore, combinedScore }) => ({
       _id: doc._id.toString(),
       embedding_id: doc.embedding_id,
       content: doc.content,
       metadata: doc.metadata,
       scores: {
-        vector_score: doc.vector_score || 0,
-        text_score: doc.text_score || 0,
-        combined_score: doc.combined_score || 0,
+        vector_score: vectorScore,
+        text_score: textScore,
+        combined_score: combinedScore,
       },
-      relevance_explanation: doc.relevance_explanation || 'No explanation available'
+      relevance_explanation: options.explain_relevance
+        ? `Vector similarity: ${vectorScore.toFixed(3)}, Text relevance: ${textScore.toFixed(3)}, Combined score: ${combinedScore.toFixed(3)}`
+        : 'No explanation available'
     }));
   }
 
@@ -289,6 +336,8 @@ export class HybridSearchEngine {
   ): Promise<HybridSearchResult[]> {
     const collection = this.db.collection('vector_embeddings');
 
+    const hasFilters = Object.keys(filterConditions).length > 0;
+
     try {
       // EXACT MongoDB Atlas $rankFusion syntax from 2025 documentation
       const pipeline: any[] = [
@@ -303,17 +352,17 @@ export class HybridSearchEngine {
                       index: options.vector_index,
                       path: 'embedding.values',
                       queryVector: queryEmbedding,
-                      numCandidates: Math.max(options.limit * 5, 100),
+                      numCandidates: numCandidatesFor(options.limit),
                       limit: options.limit,
                       // Add filters if provided (MongoDB Atlas format)
-                      ...(Object.keys(filterConditions).length > 0 && { filter: filterConditions })
+                      ...(hasFilters && { filter: filterConditions })
                     }
                   }
                 ],
                 // Named pipeline for full-text search (EXACT docs format)
                 fullTextPipeline: [
                   // Use compound query structure if filters are present
-                  ...(Object.keys(filterConditions).length > 0 ? [
+                  ...(hasFilters ? [
                     {
                       $search: {
                         index: options.text_index,
@@ -322,7 +371,7 @@ export class HybridSearchEngine {
                             {
                               text: {
                                 query: query,
-                                path: ['content.text', 'content.summary']
+                                path: TEXT_SEARCH_PATHS
                               }
                             }
                           ],
@@ -337,7 +386,7 @@ export class HybridSearchEngine {
                         index: options.text_index,
                         text: {
                           query: query,
-                          path: ['content.text', 'content.summary']
+                          path: TEXT_SEARCH_PATHS
                         }
                       }
                     }
@@ -357,6 +406,9 @@ export class HybridSearchEngine {
             scoreDetails: options.explain_relevance
           }
         },
+        // Final limit (MongoDB $rankFusion handles internal ranking) - applied
+        // before the projection so only returned documents are shaped
+        { $limit: options.limit },
         // Project results with score details from $meta
         {
           $project: {
@@ -372,9 +424,7 @@ export class HybridSearchEngine {
             }),
             ...(options.include_embeddings && { 'embedding.values': 1 })
           }
-        },
-        // Final limit (MongoDB $rankFusion handles internal ranking)
-        { $limit: options.limit }
+        }
       ];
 
       const results = await collection.aggregate(pipeline).toArray();
@@ -429,7 +479,7 @@ export class HybridSearchEngine {
                 {
                   text: {
                     query: query,
-                    path: ['content.text', 'content.summary'],
+                    path: TEXT_SEARCH_PATHS,
                   },
                 },
               ],
@@ -437,13 +487,13 @@ export class HybridSearchEngine {
             },
           },
         },
+        // $search already returns hits in score order, so cut to size before anything else
+        { $limit: options.limit || 20 },
         {
           $addFields: {
             text_score: { $meta: 'searchScore' },
           },
         },
-        { $sort: { text_score: -1 } },
-        { $limit: options.limit || 20 },
         {
           $project: {
             _id: 1,
@@ -531,7 +581,7 @@ export class HybridSearchEngine {
             index: 'vector_search_index',
             queryVector: queryEmbedding,
             path: 'embedding.values',
-            numCandidates: Math.max(limit * 10, 150),
+            numCandidates: numCandidatesFor(limit),
             limit,
             filter: filterConditions,
           },
@@ -685,30 +735,34 @@ export class HybridSearchEngine {
   }
 
   /**
-   * Get MongoDB version to determine $rankFusion support
+   * Get MongoDB version and feature support (e.g. $rankFusion requires 8.1+)
+   * The buildInfo result is cached so searches don't pay an admin round trip each time
    */
-  private async getMongoDBVersion(): Promise<string> {
+  private async getMongoDBServerInfo(): Promise<MongoDBServerInfo> {
     try {
-      const admin = this.db.admin();
-      const buildInfo = await admin.buildInfo();
-      return buildInfo.version;
+      // Concurrent searches share one buildInfo call; a failed call isn't cached
+      return await this.versionCache.get('serverInfo', async () => {
+        const buildInfo = await this.db.admin().buildInfo();
+        return this.resolveServerInfo(buildInfo.version);
+      });
     } catch (error) {
       console.warn('Could not determine MongoDB version:', error);
-      return '7.0.0'; // Assume older version if detection fails
+      return this.resolveServerInfo('7.0.0'); // Assume older version if detection fails
     }
   }
 
   /**
-   * Check if MongoDB version supports $rankFusion (requires 8.1+)
+   * Parse the version once and derive every feature flag from it
    */
-  private isRankFusionSupported(version: string): boolean {
-    try {
-      const [major, minor] = version.split('.').map(Number);
-      return major > 8 || (major === 8 && minor >= 1);
-    } catch (error) {
-      console.warn('Could not parse MongoDB version:', version);
-      return false; // Assume not supported if parsing fails
+  private resolveServerInfo(version: string): MongoDBServerInfo {
+    const parsed = parseVersion(version);
+    const features = {} as Record<MongoDBFeature, boolean>;
+
+    for (const [feature, minimum] of Object.entries(MONGODB_FEATURE_MIN_VERSIONS) as Array<[MongoDBFeature, VersionTuple]>) {
+      features[feature] = isVersionAtLeast(parsed, minimum);
     }
+
+    return { version, features };
   }
 
   /**
@@ -83,6 +83,51 @@ export interface EmotionalLearning {
   };
 }
 
+// Emotional keyword patterns, compiled once instead of on every detection
+const EMOTIONAL_PATTERNS: Record<string, string[]> = {
+  joy: ['happy', 'excited', 'great', 'wonderful', 'amazing', 'fantastic', 'love', 'perfect'],
+  sadness: ['sad', 'disappointed', 'upset', 'down', 'depressed', 'unhappy', 'terrible'],
+  anger: ['angry', 'mad', 'furious', 'annoyed', 'frustrated', 'irritated', 'outraged'],
+  fear: ['scared', 'afraid', 'worried', 'anxious', 'nervous', 'concerned', 'panic'],
+  surprise: ['surprised', 'shocked', 'amazed', 'unexpected', 'wow', 'incredible'],
+  disgust: ['disgusted', 'awful', 'horrible', 'gross', 'terrible', 'hate'],
+  trust: ['trust', 'confident', 'reliable', 'sure', 'certain', 'believe'],
+  anticipation: ['excited', 'looking forward', 'can\'t wait', 'eager', 'hopeful']
+};
+
+// Inverted index: keyword -> every emotion it signals (e.g. 'terrible' is sadness and disgust)
+const KEYWORD_EMOTIONS = new Map<string, string[]>();
+for (const [emotion, keywords] of Object.entries(EMOTIONAL_PATTERNS)) {
+  for (const keyword of keywords) {
+    KEYWORD_EMOTIONS.set(keyword, [...(KEYWORD_EMOTIONS.get(keyword) || []), emotion]);
+  }
+}
+
+// One scan of the input finds every keyword occurrence. The lookahead lets keywords
+// nested inside others still count (e.g. 'happy' within 'unhappy').
+const EMOTIONAL_KEYWORDS_PATTERN = new RegExp(`(?=(${Array.from(KEYWORD_EMOTIONS.keys()).join('|')}))`, 'g');
+
+// Valence by emotion type
+const EMOTION_VALENCE: Record<string, number> = {
+  joy: 0.8, sadness: -0.7, anger: -0.6, fear: -0.5,
+  surprise: 0.2, disgust: -0.8, trust: 0.6, anticipation: 0.4,
+  neutral: 0.0
+};
+
+// Arousal (how activating the emotion is)
+const EMOTION_AROUSAL: Record<string, number> = {
+  joy: 0.7, sadness: 0.3, anger: 0.9, fear: 0.8,
+  surprise: 0.9, disgust: 0.6, trust: 0.4, anticipation: 0.6,
+  neutral: 0.3
+};
+
+// Dominance (how much control the emotion implies)
+const EMOTION_DOMINANCE: Record<string, number> = {
+  joy: 0.6, sadness: 0.2, anger: 0.8, fear: 0.1,
+  surprise: 0.3, disgust: 0.4, trust: 0.7, anticipation: 0.5,
+  neutral: 0.5
+};
+
 /**
  * EmotionalIntelligenceEngine - Advanced emotional intelligence for AI agents
  *
@@ -157,7 +202,7 @@ export class EmotionalIntelligenceEngine {
     );
 
     // Analyze input for emotional content
-    const emotionAnalysis = await this.analyzeEmotionalContent(
+    const emotionAnalysis = this.analyzeEmotionalContent(
       context.input,
       context.conversationHistory,
       currentState
@@ -227,7 +272,7 @@ export class EmotionalIntelligenceEngine {
     // Generate response guidance
     const emotionalGuidance = this.generateEmotionalGuidance(detectedEmotion);
     const cognitiveImpact = this.assessCognitiveImpact(detectedEmotion);
-    const recommendations = await this.generateRecommendations(context, detectedEmotion);
+    const recommendations = this.generateRecommendations(context, detectedEmotion);
 
     return {
       currentEmotion: { ...emotionalState, _id: undefined } as EmotionalState,
@@ -255,7 +300,7 @@ export class EmotionalIntelligenceEngine {
     const improvements = this.generateImprovementSuggestions(patterns);
 
     // Calculate calibration metrics
-    const calibration = await this.calculateEmotionalCalibration(agentId, days);
+    const calibration = this.calculateEmotionalCalibration(agentId, days);
 
     return {
       patterns: learningPatterns,
@@ -309,32 +354,22 @@ export class EmotionalIntelligenceEngine {
   /**
    * Analyze emotional content using pattern matching and heuristics
    */
-  private async analyzeEmotionalContent(
+  private analyzeEmotionalContent(
     input: string,
     conversationHistory?: Array<{ role: string; content: string }>,
     currentState?: EmotionalState | null
-  ): Promise<EmotionDetectionResult> {
-    // Emotional keyword patterns
-    const emotionalPatterns = {
-      joy: ['happy', 'excited', 'great', 'wonderful', 'amazing', 'fantastic', 'love', 'perfect'],
-      sadness: ['sad', 'disappointed', 'upset', 'down', 'depressed', 'unhappy', 'terrible'],
-      anger: ['angry', 'mad', 'furious', 'annoyed', 'frustrated', 'irritated', 'outraged'],
-      fear: ['scared', 'afraid', 'worried', 'anxious', 'nervous', 'concerned', 'panic'],
-      surprise: ['surprised', 'shocked', 'amazed', 'unexpected', 'wow', 'incredible'],
-      disgust: ['disgusted', 'awful', 'horrible', 'gross', 'terrible', 'hate'],
-      trust: ['trust', 'confident', 'reliable', 'sure', 'certain', 'believe'],
-      anticipation: ['excited', 'looking forward', 'can\'t wait', 'eager', 'hopeful']
-    };
-
+  ): EmotionDetectionResult {
     const inputLower = input.toLowerCase();
     const emotionScores: Record<string, number> = {};
+    for (const emotion of Object.keys(EMOTIONAL_PATTERNS)) {
+      emotionScores[emotion] = 0;
+    }
 
     // Calculate emotion scores based on keyword matching
-    for (const [emotion, keywords] of Object.entries(emotionalPatterns)) {
-      emotionScores[emotion] = keywords.reduce((score, keyword) => {
-        const matches = (inputLower.match(new RegExp(keyword, 'g')) || []).length;
-        return score + matches;
-      }, 0);
+    for (const [, keyword] of inputLower.matchAll(EMOTIONAL_KEYWORDS_PATTERN)) {
+      for (const emotion of KEYWORD_EMOTIONS.get(keyword)!) {
+        emotionScores[emotion]++;
+      }
     }
 
     // Find primary emotion
@@ -345,31 +380,13 @@ export class EmotionalIntelligenceEngine {
     const intensity = primaryEmotion[1] === 0 ? 0.1 : Math.min(primaryEmotion[1] * 0.3, 1.0);
 
     // Calculate valence based on emotion type
-    const valenceMap: Record<string, number> = {
-      joy: 0.8, sadness: -0.7, anger: -0.6, fear: -0.5,
-      surprise: 0.2, disgust: -0.8, trust: 0.6, anticipation: 0.4,
-      neutral: 0.0
-    };
-
-    const valence = valenceMap[primary] || 0;
+    const valence = EMOTION_VALENCE[primary] || 0;
 
     // Calculate arousal (how activating the emotion is)
-    const arousalMap: Record<string, number> = {
-      joy: 0.7, sadness: 0.3, anger: 0.9, fear: 0.8,
-      surprise: 0.9, disgust: 0.6, trust: 0.4, anticipation: 0.6,
-      neutral: 0.3
-    };
-
-    const arousal = arousalMap[primary] || 0.5;
+    const arousal = EMOTION_AROUSAL[primary] || 0.5;
 
     // Calculate dominance (how much control the emotion implies)
-    const dominanceMap: Record<string, number> = {
-      joy: 0.6, sadness: 0.2, anger: 0.8, fear: 0.1,
-      surprise: 0.3, disgust: 0.4, trust: 0.7, anticipation: 0.5,
-      neutral: 0.5
-    };
-
-    const dominance = dominanceMap[primary] || 0.5;
+    const dominance = EMOTION_DOMINANCE[primary] || 0.5;
 
     // Determine secondary emotions
     const secondary = Object.entries(emotionScores)
@@ -509,10 +526,10 @@ export class EmotionalIntelligenceEngine {
   /**
    * Generate recommendations based on emotional state
    */
-  private async generateRecommendations(
+  private generateRecommendations(
     context: EmotionalContext,
     emotion: EmotionDetectionResult
-  ): Promise<string[]> {
+  ): string[] {
     const recommendations = [];
 
     if (emotion.intensity > 0.8) {
@@ -589,11 +606,11 @@ export class EmotionalIntelligenceEngine {
   /**
    * Calculate emotional calibration metrics
    */
-  private async calculateEmotionalCalibration(agentId: string, days: number): Promise<{
+  private calculateEmotionalCalibration(agentId: string, days: number): {
     accuracy: number;
     bias: number;
     consistency: number;
-  }> {
+  } {
     // This would typically involve comparing predicted vs actual emotional outcomes
     // For now, return simulated metrics
     return {
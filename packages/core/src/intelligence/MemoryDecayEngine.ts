@@ -131,33 +131,27 @@ export class MemoryDecayEngine {
         memoryTypes: {}
       };
 
-      // Get all memories for processing
-      const memories = await this.memoryCollection.find({}).toArray();
-      stats.totalMemories = memories.length;
+      // Stream memories instead of loading the collection; decay only reads metadata
+      const cursor = this.memoryCollection.find({}, { projection: { metadata: 1 } });
+      let importanceSum = 0;
+      let oldest = Infinity;
+      let newest = -Infinity;
 
-      if (memories.length === 0) {
-        console.log('📭 No memories to process');
-        return stats;
-      }
+      for await (const memory of cursor) {
+        stats.totalMemories++;
+        importanceSum += memory.metadata?.importance || 0;
 
-      // Calculate stats
-      const importanceSum = memories.reduce((sum, m) => sum + (m.metadata?.importance || 0), 0);
-      stats.averageImportance = importanceSum / memories.length;
-      
-      const dates = memories.map(m => new Date(m.metadata?.created || Date.now()));
-      stats.oldestMemory = new Date(Math.min(...dates.map(d => d.getTime())));
-      stats.newestMemory = new Date(Math.max(...dates.map(d => d.getTime())));
+        const created = new Date(memory.metadata?.created || Date.now()).getTime();
+        oldest = Math.min(oldest, created);
+        newest = Math.max(newest, created);
 
-      // Count memory types
-      memories.forEach(memory => {
+        // Count memory types
         const type = memory.metadata?.type || 'unknown';
         stats.memoryTypes[type] = (stats.memoryTypes[type] || 0) + 1;
-      });
 
-      // Process each memory
-      for (const memory of memories) {
+        // Process each memory as it arrives
         const decayResult = await this.processMemoryDecay(memory);
-        
+
         if (decayResult.removed) {
           stats.memoriesRemoved++;
         } else if (decayResult.decayed) {
@@ -165,6 +159,16 @@ export class MemoryDecayEngine {
         }
       }
 
+      if (stats.totalMemories === 0) {
+        console.log('📭 No memories to process');
+        return stats;
+      }
+
+      // Calculate stats
+      stats.averageImportance = importanceSum / stats.totalMemories;
+      stats.oldestMemory = new Date(oldest);
+      stats.newestMemory = new Date(newest);
+
       // Cleanup phase - remove memories below threshold
       await this.cleanupObsoleteMemories(stats);
 
@@ -297,7 +301,7 @@ export class MemoryDecayEngine {
    * Cleanup obsolete memories to maintain performance
    */
   private async cleanupObsoleteMemories(stats: MemoryDecayStats): Promise<void> {
-    const totalMemories = await this.memoryCollection.countDocuments();
+    const totalMemories = await this.memoryCollection.estimatedDocumentCount();
     
     if (totalMemories <= this.config.cleanupThresholds.maxMemories) {
       return; // No cleanup needed
@@ -377,9 +381,30 @@ export class MemoryDecayEngine {
    * Get memory decay statistics
    */
   async getDecayStats(): Promise<MemoryDecayStats> {
-    const memories = await this.memoryCollection.find({}).toArray();
-    
-    if (memories.length === 0) {
+    // Stream just the metadata we aggregate instead of loading every full memory document
+    const cursor = this.memoryCollection.find({}, {
+      projection: { 'metadata.importance': 1, 'metadata.created': 1, 'metadata.type': 1 }
+    });
+
+    let totalMemories = 0;
+    let importanceSum = 0;
+    let oldest = Infinity;
+    let newest = -Infinity;
+    const memoryTypes: Record<string, number> = {};
+
+    for await (const memory of cursor) {
+      totalMemories++;
+      importanceSum += memory.metadata?.importance || 0;
+
+      const created = new Date(memory.metadata?.created || Date.now()).getTime();
+      if (created < oldest) oldest = created;
+      if (created > newest) newest = created;
+
+      const type = memory.metadata?.type || 'unknown';
+      memoryTypes[type] = (memoryTypes[type] || 0) + 1;
+    }
+
+    if (totalMemories === 0) {
       return {
         totalMemories: 0,
         memoriesDecayed: 0,
@@ -391,22 +416,13 @@ export class MemoryDecayEngine {
       };
     }
 
-    const importanceSum = memories.reduce((sum, m) => sum + (m.metadata?.importance || 0), 0);
-    const dates = memories.map(m => new Date(m.metadata?.created || Date.now()));
-    
-    const memoryTypes: Record<string, number> = {};
-    memories.forEach(memory => {
-      const type = memory.metadata?.type || 'unknown';
-      memoryTypes[type] = (memoryTypes[type] || 0) + 1;
-    });
-
     return {
-      totalMemories: memories.length,
+      totalMemories,
       memoriesDecayed: 0, // Would be calculated during actual decay
       memoriesRemoved: 0, // Would be calculated during actual decay
-      averageImportance: importanceSum / memories.length,
-      oldestMemory: new Date(Math.min(...dates.map(d => d.getTime()))),
-      newestMemory: new Date(Math.max(...dates.map(d => d.getTime()))),
+      averageImportance: importanceSum / totalMemories,
+      oldestMemory: new Date(oldest),
+      newestMemory: new Date(newest),
       memoryTypes
     };
   }
@@ -468,8 +468,8 @@ export class SelfImprovementEngine {
    * Load existing patterns for immediate use
    */
   private async loadExistingPatterns(): Promise<void> {
-    const patternCount = await this.failurePatternsCollection.countDocuments();
-    const insightCount = await this.learningInsightsCollection.countDocuments();
+    const patternCount = await this.failurePatternsCollection.estimatedDocumentCount();
+    const insightCount = await this.learningInsightsCollection.estimatedDocumentCount();
     
     console.log(`📊 Loaded ${patternCount} failure patterns and ${insightCount} learning insights`);
   }
@@ -484,15 +484,17 @@ export class SelfImprovementEngine {
     averageConfidence: number;
   }> {
     const [failureCount, insightCount, improvementCount] = await Promise.all([
-      this.failurePatternsCollection.countDocuments(),
-      this.learningInsightsCollection.countDocuments(),
-      this.improvementMetricsCollection.countDocuments()
+      this.failurePatternsCollection.estimatedDocumentCount(),
+      this.learningInsightsCollection.estimatedDocumentCount(),
+      this.improvementMetricsCollection.estimatedDocumentCount()
     ]);
 
-    const insights = await this.learningInsightsCollection.find({}).toArray();
-    const averageConfidence = insights.length > 0 
-      ? insights.reduce((sum, i) => sum + i.confidence, 0) / insights.length 
-      : 0;
+    // Only the mean is needed, so let the server compute it instead of
+    // shipping every insight document back to be summed here
+    const [confidenceStats] = await this.learningInsightsCollection.aggregate<{ averageConfidence: number | null }>([
+      { $group: { _id: null, averageConfidence: { $avg: '$confidence' } } }
+    ]).toArray();
+    const averageConfidence = confidenceStats?.averageConfidence ?? 0;
 
     return {
       totalFailuresLearned: failureCount,
@@ -17,6 +17,8 @@
 import { MemoryCollection } from '../collections/MemoryCollection';
 import { OpenAIEmbeddingProvider } from '../embeddings/OpenAIEmbeddingProvider';
 import { EmbeddingProvider } from '../vector/MongoVectorStore';
+import { numCandidatesFor } from '../utils/vectorSearch';
+import { PromiseCache } from '../utils/promiseCache';
 import { MemoryImportance } from '../types';
 
 export interface Memory {
@@ -89,6 +91,7 @@ export class SemanticMemoryEngine {
   private embeddingProvider: EmbeddingProvider;
   private memoryCache: Map<string, Memory> = new Map();
   private cacheSize: number = 1000;
+  private queryEmbeddingCache: PromiseCache<string, number[]> = new PromiseCache(256);
 
   constructor(
     memoryCollection: MemoryCollection,
@@ -195,7 +198,7 @@ export class SemanticMemoryEngine {
 
     try {
       // Generate query embedding
-      const queryEmbedding = await this.embeddingProvider.generateEmbedding(query);
+      const queryEmbedding = await this.getQueryEmbedding(query);
 
       // Build filter conditions
       const filterConditions: any = {
@@ -238,7 +241,7 @@ export class SemanticMemoryEngine {
             index: 'memory_vector_index',
             path: 'embedding.values',
             queryVector: queryEmbedding,
-            numCandidates: Math.max(limit * 10, 100),
+            numCandidates: numCandidatesFor(limit),
             limit: limit * 2, // Get more candidates for filtering
             filter: filterConditions
           }
@@ -500,6 +503,13 @@ export class SemanticMemoryEngine {
     };
   }
 
+  /**
+   * Get the embedding for a retrieval query, reusing it for repeated queries
+   */
+  private getQueryEmbedding(query: string): Promise<number[]> {
+    return this.queryEmbeddingCache.get(query, () => this.embeddingProvider.generateEmbedding(query));
+  }
+
   private updateCache(memory: Memory): void {
     // Simple LRU cache implementation
     if (this.memoryCache.size >= this.cacheSize) {
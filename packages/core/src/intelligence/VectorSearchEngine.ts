@@ -14,9 +14,12 @@
  * - Search caching and performance optimization
  */
 
-import { Db, ObjectId } from 'mongodb';
+import { Binary, Db } from 'mongodb';
 import { OpenAIEmbeddingProvider } from '../embeddings/OpenAIEmbeddingProvider';
 import { EmbeddingProvider } from '../vector/MongoVectorStore';
+import { numCandidatesFor } from '../utils/vectorSearch';
+import { TEXT_SEARCH_PATHS } from '../utils/search';
+import { PromiseCache } from '../utils/promiseCache';
 
 export interface SearchResult {
   id: string;
@@ -87,13 +90,17 @@ export class VectorSearchEngine {
   private searchCache: Map<string, { results: SearchResult[]; timestamp: number }> = new Map();
   private cacheSize: number = 1000;
   private cacheTTL: number = 5 * 60 * 1000; // 5 minutes
+  private embeddingCache: PromiseCache<string, number[]> = new PromiseCache(500);
+  private rankFusionUnsupported: boolean = false;
+  private vectorEncoding: 'array' | 'float32';
 
   constructor(
     db: Db,
     embeddingProvider?: EmbeddingProvider,
     collectionName: string = 'vector_embeddings',
     vectorIndexName: string = 'vector_search_index',
-    textIndexName: string = 'text_search_index'
+    textIndexName: string = 'text_search_index',
+    vectorEncoding: 'array' | 'float32' = 'array'
   ) {
     this.db = db;
     this.embeddingProvider = embeddingProvider || new OpenAIEmbeddingProvider({
@@ -103,6 +110,7 @@ export class VectorSearchEngine {
     this.collectionName = collectionName;
     this.vectorIndexName = vectorIndexName;
     this.textIndexName = textIndexName;
+    this.vectorEncoding = vectorEncoding;
   }
 
   /**
@@ -141,7 +149,7 @@ export class VectorSearchEngine {
         {
           limit,
           minScore,
-          maxCandidates: maxCandidates || Math.max(limit * 10, 150),
+          maxCandidates: maxCandidates || numCandidatesFor(limit),
           filters,
           boost,
           includeEmbeddings,
@@ -197,6 +205,11 @@ export class VectorSearchEngine {
         return cached;
       }
 
+      // Don't retry $rankFusion once the server has rejected it
+      if (this.rankFusionUnsupported) {
+        return await this.semanticSearch(query, options);
+      }
+
       // Generate query embedding
       const queryEmbedding = await this.createEmbedding(query);
 
@@ -232,17 +245,32 @@ export class VectorSearchEngine {
       return searchResults;
     } catch (error) {
       console.error('Hybrid search failed:', error);
+      if (this.isUnsupportedStageError(error)) {
+        console.warn('⚠️ $rankFusion is not supported by this MongoDB deployment - using semantic search from now on');
+        this.rankFusionUnsupported = true;
+      }
       // Fallback to semantic search
       return await this.semanticSearch(query, options);
     }
   }
 
+  /**
+   * Check whether an aggregation failed because the server doesn't know a pipeline stage
+   */
+  private isUnsupportedStageError(error: unknown): boolean {
+    const code = (error as { code?: number })?.code;
+    const message = error instanceof Error ? error.message : String(error);
+    return code === 40324 || message.includes('Unrecognized pipeline stage name');
+  }
+
   /**
    * Create embedding for text
    */
   async createEmbedding(text: string): Promise<number[]> {
+    // Embeddings are deterministic per text, so share one request per string -
+    // including concurrent callers and the semantic fallback after a failed hybrid search
     try {
-      return await this.embeddingProvider.generateEmbedding(text);
+      return await this.embeddingCache.get(text, () => this.embeddingProvider.generateEmbedding(text));
     } catch (error) {
       console.error('Failed to create embedding:', error);
       const errorMessage = error instanceof Error ? error.message : String(error);
@@ -272,21 +300,28 @@ export class VectorSearchEngine {
           createdAt: new Date(),
           updatedAt: new Date()
         },
-        // Store embedding in the format expected by Atlas Vector Search
+        // Store embedding in the format expected by Atlas Vector Search; a packed
+        // float32 BSON vector is a third of the size of an array of doubles
         embedding: {
-          values: embedding
+          values: this.vectorEncoding === 'float32'
+            ? Binary.fromFloat32Array(Float32Array.from(embedding))
+            : embedding
         }
       };
 
       const collection = this.db.collection(this.collectionName);
 
-      // Use upsert to handle both insert and update cases
+      // Use upsert to handle both insert and update cases; the _id is stored as
+      // the given string, so match on it as-is
       const result = await collection.replaceOne(
-        { _id: new ObjectId(document._id) },
+        { _id: document._id },
         document,
         { upsert: true }
       );
 
+      // Cached searches may no longer reflect the collection
+      this.searchCache.clear();
+
       console.log(`✅ Document stored with ID: ${document._id}`);
       return document._id;
     } catch (error) {
@@ -329,7 +364,7 @@ export class VectorSearchEngine {
                 {
                   text: {
                     query: query,
-                    path: ['content.text', 'content.summary']
+                    path: TEXT_SEARCH_PATHS
                   }
                 }
               ],
@@ -337,13 +372,13 @@ export class VectorSearchEngine {
             }
           }
         },
+        // $search already returns hits in score order, so cut to size before anything else
+        { $limit: limit },
         {
           $addFields: {
             textScore: { $meta: 'searchScore' }
           }
         },
-        { $sort: { textScore: -1 } },
-        { $limit: limit },
         {
           $project: {
             _id: 1,
@@ -540,7 +575,7 @@ export class VectorSearchEngine {
                     index: this.vectorIndexName,
                     path: 'embedding.values',
                     queryVector: queryEmbedding,
-                    numCandidates: Math.max(options.limit * 10, 150),
+                    numCandidates: numCandidatesFor(options.limit),
                     limit: options.limit * 2,
                     filter: options.filters
                   }
@@ -555,7 +590,7 @@ export class VectorSearchEngine {
                         {
                           text: {
                             query: options.textQuery,
-                            path: ['content.text', 'content.summary']
+                            path: TEXT_SEARCH_PATHS
                           }
                         }
                       ],
@@ -573,16 +608,32 @@ export class VectorSearchEngine {
               textPipeline: options.textWeight
             }
           },
-          scoreDetails: true
+          // Per-pipeline breakdowns are only worth computing when explaining results
+          scoreDetails: options.includeExplanation
+        }
+      },
+      // Filter by minimum score and limit results before shaping them,
+      // so the projection only runs on documents that are returned
+      {
+        $addFields: {
+          hybridScore: options.includeExplanation
+            ? { $meta: 'scoreDetails' }
+            : { value: { $meta: 'score' } }
         }
       },
+      {
+        $match: {
+          'hybridScore.value': { $gte: options.minScore }
+        }
+      },
+      { $limit: options.limit },
       // Project results AFTER $rankFusion (this is allowed)
       {
         $project: {
           _id: 1,
           content: 1,
           metadata: 1,
-          hybridScore: { $meta: 'scoreDetails' },
+          hybridScore: 1,
           ...(options.includeEmbeddings && { 'embedding.values': 1 }),
           ...(options.includeExplanation && {
             explanation: {
@@ -595,14 +646,7 @@ export class VectorSearchEngine {
             }
           })
         }
-      },
-      // Filter by minimum score and limit results
-      {
-        $match: {
-          'hybridScore.value': { $gte: options.minScore }
-        }
-      },
-      { $limit: options.limit }
+      }
     ];
   }
 
@@ -616,17 +660,26 @@ export class VectorSearchEngine {
       content: doc.content?.text || doc.content || '',
       score: doc.hybridScore?.value || doc.combinedScore || doc.vectorScore || doc.textScore || 0,
       metadata: doc.metadata || {},
-      embedding: doc.embedding?.values,
+      embedding: doc.embedding?.values instanceof Binary
+        ? Array.from(doc.embedding.values.toFloat32Array())
+        : doc.embedding?.values,
       explanation: doc.explanation || (includeExplanation ? `${searchType} search result` : undefined)
     }));
   }
 
   private generateCacheKey(type: string, query: string, options: any): string {
+    // Every option that changes the result set has to be part of the key,
+    // otherwise searches with different fusion weights share an entry
     const keyData = {
       type,
-      query: query.substring(0, 100),
+      query,
+      textQuery: options.textQuery,
       limit: options.limit,
       minScore: options.minScore,
+      vectorWeight: options.vectorWeight,
+      textWeight: options.textWeight,
+      includeEmbeddings: options.includeEmbeddings,
+      includeExplanation: options.includeExplanation,
       filters: JSON.stringify(options.filters || {})
     };
     return JSON.stringify(keyData);
@@ -642,6 +695,9 @@ export class VectorSearchEngine {
       return null;
     }
 
+    // Re-insert so eviction drops the least recently used entry
+    this.searchCache.delete(key);
+    this.searchCache.set(key, cached);
     return cached.results;
   }
 
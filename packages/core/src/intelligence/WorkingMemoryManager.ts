@@ -405,7 +405,7 @@ export class WorkingMemoryManager {
    * Get memory pressure statistics
    */
   async getMemoryPressure(): Promise<MemoryPressureStats> {
-    const totalMemories = await this.workingMemoryCollection.countDocuments();
+    const totalMemories = await this.workingMemoryCollection.estimatedDocumentCount();
     const expiredCount = await this.workingMemoryCollection.countDocuments({
       expires: { $lt: new Date() }
     });
@@ -401,8 +401,8 @@ export class SystemHealthMonitor {
   }> {
     const frameworks = ['vercelAI', 'mastra', 'openaiAgents', 'langchain'];
     
-    const healthChecks = await Promise.all(
-      frameworks.map(framework => this.checkFrameworkHealth(framework))
+    const healthChecks = await this.settleHealthChecks(
+      frameworks.map((framework): [string, () => Promise<HealthCheckResult>] => [framework, () => this.checkFrameworkHealth(framework)])
     );
 
     return {
@@ -477,10 +477,10 @@ export class SystemHealthMonitor {
     embeddingService: HealthCheckResult;
     vectorSearch: HealthCheckResult;
   }> {
-    const [openaiHealth, embeddingHealth, vectorSearchHealth] = await Promise.all([
-      this.checkOpenAIHealth(),
-      this.checkEmbeddingServiceHealth(),
-      this.checkVectorSearchHealth()
+    const [openaiHealth, embeddingHealth, vectorSearchHealth] = await this.settleHealthChecks([
+      ['openaiAPI', () => this.checkOpenAIHealth()],
+      ['embeddingService', () => this.checkEmbeddingServiceHealth()],
+      ['vectorSearch', () => this.checkVectorSearchHealth()]
     ]);
 
     return {
@@ -499,11 +499,11 @@ export class SystemHealthMonitor {
     disk: HealthCheckResult;
     network: HealthCheckResult;
   }> {
-    const [cpuHealth, memoryHealth, diskHealth, networkHealth] = await Promise.all([
-      this.checkCPUHealth(),
-      this.checkMemoryHealth(),
-      this.checkDiskHealth(),
-      this.checkNetworkHealth()
+    const [cpuHealth, memoryHealth, diskHealth, networkHealth] = await this.settleHealthChecks([
+      ['cpu', () => this.checkCPUHealth()],
+      ['memory', () => this.checkMemoryHealth()],
+      ['disk', () => this.checkDiskHealth()],
+      ['network', () => this.checkNetworkHealth()]
     ]);
 
     return {
@@ -514,6 +514,35 @@ export class SystemHealthMonitor {
     };
   }
 
+  /**
+   * Run health checks in parallel, turning a check that throws into an unhealthy
+   * result for that service instead of failing the whole batch
+   */
+  private async settleHealthChecks(
+    checks: Array<[string, () => Promise<HealthCheckResult>]>
+  ): Promise<HealthCheckResult[]> {
+    const startTime = Date.now();
+    const settled = await Promise.allSettled(checks.map(([, check]) => check()));
+
+    return settled.map((result, index) => {
+      if (result.status === 'fulfilled') {
+        return result.value;
+      }
+
+      const service = checks[index][0];
+      return {
+        service,
+        status: 'unhealthy',
+        responseTime: Date.now() - startTime,
+        timestamp: new Date(),
+        details: {
+          message: `${service} health check failed`,
+          error: result.reason instanceof Error ? result.reason.message : String(result.reason)
+        }
+      };
+    });
+  }
+
   // Helper methods for specific health checks
   private async getRecentFrameworkActivity(framework: string): Promise<any> {
     const since = new Date(Date.now() - 5 * 60 * 1000); // Last 5 minutes
@@ -7,7 +7,7 @@ export interface MongoConnectionConfig {
 }
 
 export class MongoConnection {
-  private static instance: MongoConnection;
+  private static instances: Map<string, MongoConnection> = new Map();
   private client: MongoClient;
   private db: Db;
   private config: MongoConnectionConfig;
@@ -24,6 +24,7 @@ export class MongoConnection {
       family: 4, // Use IPv4, skip trying IPv6
       retryWrites: true,
       retryReads: true,
+      compressors: ['snappy', 'zlib'], // Compress wire traffic; the server picks the first it supports
       ...config.options
     };
 
@@ -31,11 +32,18 @@ export class MongoConnection {
     this.db = this.client.db(config.dbName);
   }
 
+  /**
+   * Get the shared connection for a URI and database, creating it on first use.
+   * Callers asking for the same target reuse one pooled client.
+   */
   public static getInstance(config: MongoConnectionConfig): MongoConnection {
-    if (!MongoConnection.instance) {
-      MongoConnection.instance = new MongoConnection(config);
+    const key = `${config.uri}::${config.dbName}`;
+    let instance = MongoConnection.instances.get(key);
+    if (!instance) {
+      instance = new MongoConnection(config);
+      MongoConnection.instances.set(key, instance);
     }
-    return MongoConnection.instance;
+    return instance;
   }
 
   public async connect(): Promise<void> {
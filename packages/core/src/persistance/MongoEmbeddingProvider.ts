@@ -1,5 +1,7 @@
 import { Collection, Db, Document } from 'mongodb';
 import { IEmbeddingStore, EmbeddedDocument, SimilaritySearchResult } from './IEmbeddingStore';
+import { topK } from '../utils/topK';
+import { numCandidatesFor } from '../utils/vectorSearch';
 
 export class MongoEmbeddingProvider<T extends Document> implements IEmbeddingStore<T> {
   private collection: Collection<EmbeddedDocument<T>>;
@@ -15,12 +17,12 @@ export class MongoEmbeddingProvider<T extends Document> implements IEmbeddingSto
   }
 
   async addMany(docs: EmbeddedDocument<T>[]): Promise<void> {
-    await this.collection.insertMany(docs as any);
+    await this.collection.insertMany(docs as any, { ordered: false });
   }
 
   async findSimilar(query: number[], options?: { k?: number; filter?: any }): Promise<SimilaritySearchResult<T>[]> {
     const limit = options?.k ?? 10;
-    const numCandidates = Math.max(limit * 10, 150);
+    const numCandidates = numCandidatesFor(limit);
 
     const pipeline: Document[] = [
       {
@@ -65,7 +67,7 @@ export class MongoEmbeddingProvider<T extends Document> implements IEmbeddingSto
     }
   ): Promise<SimilaritySearchResult<T>[]> {
     const limit = options?.k ?? 10;
-    const numCandidates = Math.max(limit * 10, 150);
+    const numCandidates = numCandidatesFor(limit);
     const minScore = options?.minScore ?? 0.7;
 
     const pipeline: Document[] = [
@@ -123,11 +125,8 @@ export class MongoEmbeddingProvider<T extends Document> implements IEmbeddingSto
     textQuery?: string,
     options?: { k?: number; filter?: any; minScore?: number }
   ): Promise<SimilaritySearchResult<T>[]> {
-    // First get vector search results
-    const vectorResults = await this.vectorSearchWithMetadata(query, options);
-
     if (!textQuery) {
-      return vectorResults;
+      return this.vectorSearchWithMetadata(query, options);
     }
 
     // Combine with text search for hybrid results
@@ -142,45 +141,49 @@ export class MongoEmbeddingProvider<T extends Document> implements IEmbeddingSto
         }
       },
       {
-        $addFields: {
-          score: { $meta: 'searchScore' }
-        }
+        $limit: options?.k ?? 10
       },
+      // Return only what the merge reads - the stored embedding is never used
       {
-        $limit: options?.k ?? 10
+        $project: {
+          _id: 0,
+          document: 1,
+          score: { $meta: 'searchScore' }
+        }
       }
     ];
 
-    try {
-      const textResults = await this.collection.aggregate(textSearchPipeline).toArray();
-
-      // Merge and deduplicate results
-      const combinedResults = new Map<string, SimilaritySearchResult<T>>();
+    // Vector and text searches are independent - run them concurrently.
+    // A failed text search degrades to vector-only results.
+    const [vectorResults, textResults] = await Promise.all([
+      this.vectorSearchWithMetadata(query, options),
+      this.collection.aggregate<SimilaritySearchResult<T>>(textSearchPipeline).toArray().catch(error => {
+        console.warn('Text search failed, falling back to vector search only:', error);
+        return null;
+      })
+    ]);
+
+    if (!textResults) {
+      return vectorResults;
+    }
 
-      // Add vector results with higher weight
-      vectorResults.forEach(result => {
+    // Merge and deduplicate in one pass: vector results (weight 0.7) come first,
+    // so a document found by both searches keeps its vector score
+    const combinedResults = new Map<string, SimilaritySearchResult<T>>();
+    const branches: Array<[SimilaritySearchResult<T>[], number]> = [
+      [vectorResults, 0.7],
+      [textResults, 0.3]
+    ];
+    for (const [results, weight] of branches) {
+      for (const result of results) {
         const key = result.document._id?.toString() || JSON.stringify(result.document);
-        combinedResults.set(key, { ...result, score: result.score * 0.7 });
-      });
-
-      // Add text results with lower weight
-      textResults.forEach(result => {
-        const key = result._id?.toString() || JSON.stringify(result);
         if (!combinedResults.has(key)) {
-          combinedResults.set(key, {
-            document: result,
-            score: result.score * 0.3
-          } as SimilaritySearchResult<T>);
+          combinedResults.set(key, { ...result, score: result.score * weight });
         }
-      });
-
-      return Array.from(combinedResults.values())
-        .sort((a, b) => b.score - a.score)
-        .slice(0, options?.k || 10);
-    } catch (error) {
-      console.warn('Text search failed, falling back to vector search only:', error);
-      return vectorResults;
+      }
     }
+
+    return topK(combinedResults.values(), options?.k || 10, result => result.score);
   }
 
   /**
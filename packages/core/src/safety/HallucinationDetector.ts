@@ -19,6 +19,9 @@ import { TracingCollection } from '../collections/TracingCollection';
 import { MemoryCollection } from '../collections/MemoryCollection';
 import { MongoVectorStore } from '../vector/MongoVectorStore';
 
+// Words that flip the polarity of a statement, checked once per word
+const NEGATION_WORDS = new Set(['not', 'no', 'never', 'none', 'neither', 'cannot', 'isn\'t', 'aren\'t', 'won\'t']);
+
 export interface HallucinationAnalysis {
   isGrounded: boolean;
   confidenceScore: number; // 0-1 scale
@@ -571,21 +574,21 @@ export class HallucinationDetector {
     const words1 = text1.toLowerCase().split(/\s+/);
     const words2 = text2.toLowerCase().split(/\s+/);
     
-    const commonWords = words1.filter(word => words2.includes(word) && word.length > 3);
+    // Hash the context words once instead of rescanning them for every claim word
+    const words2Set = new Set(words2);
+    const commonWords = words1.filter(word => word.length > 3 && words2Set.has(word));
     return commonWords.length / Math.max(words1.length, words2.length);
   }
 
   private async detectContradiction(claim: string, context: string): Promise<boolean> {
     // Simplified contradiction detection
     // Look for negation patterns
-    const negationWords = ['not', 'no', 'never', 'none', 'neither', 'cannot', 'isn\'t', 'aren\'t', 'won\'t'];
-    
     const claimWords = claim.toLowerCase().split(/\s+/);
     const contextWords = context.toLowerCase().split(/\s+/);
     
     // Check if one has negation and the other doesn't for similar content
-    const claimHasNegation = claimWords.some(word => negationWords.includes(word));
-    const contextHasNegation = contextWords.some(word => negationWords.includes(word));
+    const claimHasNegation = claimWords.some(word => NEGATION_WORDS.has(word));
+    const contextHasNegation = contextWords.some(word => NEGATION_WORDS.has(word));
     
     return claimHasNegation !== contextHasNegation;
   }
@@ -17,6 +17,9 @@
 import { TracingCollection, AgentTrace, AgentError } from '../collections/TracingCollection';
 import { MemoryCollection } from '../collections/MemoryCollection';
 
+// Words ignored when extracting a topic from a query
+const TOPIC_STOP_WORDS = new Set(['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by']);
+
 export interface FailurePattern {
   id: string;
   type: 'context_gap' | 'prompt_weakness' | 'framework_error' | 'timeout' | 'safety_violation' | 'unknown';
@@ -435,8 +438,7 @@ export class FailureAnalysisEngine {
   private async extractTopicFromQuery(query: string): Promise<string> {
     // Simple topic extraction - could be enhanced with NLP
     const words = query.toLowerCase().split(' ');
-    const stopWords = ['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'];
-    const keywords = words.filter(word => !stopWords.includes(word) && word.length > 3);
+    const keywords = words.filter(word => word.length > 3 && !TOPIC_STOP_WORDS.has(word));
     return keywords.slice(0, 3).join(' ') || 'unknown topic';
   }
 
@@ -0,0 +1,34 @@
+/**
+ * @file Concurrency utilities for Universal AI Brain
+ *
+ * Runs async work over a list with a fixed number of workers, so callers can
+ * keep several requests in flight without firing all of them at once.
+ */
+
+/**
+ * Map items through an async function with at most `concurrency` calls in
+ * flight; results keep the input order
+ */
+export async function mapWithConcurrency<T, R>(
+  items: T[],
+  concurrency: number,
+  fn: (item: T, index: number) => Promise<R>
+): Promise<R[]> {
+  if (!Number.isInteger(concurrency) || concurrency < 1) {
+    throw new Error(`Concurrency must be a positive integer, got ${concurrency}`);
+  }
+
+  // Each worker claims the next index and writes its result into that slot
+  const results: R[] = new Array(items.length);
+  let nextIndex = 0;
+  const worker = async (): Promise<void> => {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await fn(items[index], index);
+    }
+  };
+
+  const workerCount = Math.min(concurrency, items.length);
+  await Promise.all(Array.from({ length: workerCount }, () => worker()));
+  return results;
+}
@@ -0,0 +1,59 @@
+/**
+ * @file Bounded promise cache for Universal AI Brain
+ *
+ * Caches the pending promise per key so concurrent callers share one request.
+ * The oldest entry is evicted once the cache is full, rejected promises are
+ * dropped so the next call retries, and entries can optionally expire.
+ */
+
+export class PromiseCache<K, V> {
+  private entries: Map<K, { promise: Promise<V>; timestamp: number }> = new Map();
+  private maxSize: number;
+  private ttlMs?: number;
+
+  constructor(maxSize: number, ttlMs?: number) {
+    if (!(maxSize >= 1)) {
+      throw new Error('PromiseCache maxSize must be at least 1');
+    }
+    this.maxSize = maxSize;
+    this.ttlMs = ttlMs;
+  }
+
+  /**
+   * Return the cached promise for a key, calling load to create it when missing or expired
+   */
+  get(key: K, load: () => Promise<V>): Promise<V> {
+    const cached = this.entries.get(key);
+    if (cached && (this.ttlMs === undefined || Date.now() - cached.timestamp <= this.ttlMs)) {
+      return cached.promise;
+    }
+
+    this.entries.delete(key);
+    if (this.entries.size >= this.maxSize) {
+      const oldest = this.entries.keys().next();
+      if (!oldest.done) {
+        this.entries.delete(oldest.value);
+      }
+    }
+
+    // A synchronous throw from load becomes a rejection like any other failure
+    const promise = new Promise<V>(resolve => resolve(load()));
+    const entry = { promise, timestamp: Date.now() };
+    this.entries.set(key, entry);
+    promise.catch(() => {
+      // Don't keep failures around - unless the entry was already replaced
+      if (this.entries.get(key) === entry) {
+        this.entries.delete(key);
+      }
+    });
+    return promise;
+  }
+
+  clear(): void {
+    this.entries.clear();
+  }
+
+  get size(): number {
+    return this.entries.size;
+  }
+}
@@ -0,0 +1,9 @@
+/**
+ * @file Atlas Search constants for Universal AI Brain
+ */
+
+/**
+ * Fields covered by the Atlas Search text index on vector_embeddings documents;
+ * every text and hybrid pipeline over that collection searches these paths
+ */
+export const TEXT_SEARCH_PATHS = ['content.text', 'content.summary'];
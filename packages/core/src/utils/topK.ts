@@ -0,0 +1,62 @@
+/**
+ * @file Top-k selection utilities for Universal AI Brain
+ *
+ * Search fusion only ever returns the best few results, so selecting them with
+ * a bounded min-heap costs O(n log k) instead of sorting every candidate.
+ */
+
+/**
+ * Return the k highest-scoring items in descending score order; equal scores
+ * keep their input order, as a stable sort would
+ */
+export function topK<T>(items: Iterable<T>, k: number, score: (item: T) => number): T[] {
+  if (k <= 0) {
+    return [];
+  }
+
+  // Min-heap of the best k seen so far; the root is the weakest kept item.
+  // Among equal scores the later input is weaker, so ties resolve in input order.
+  const heap: Array<{ item: T; score: number; order: number }> = [];
+  const weaker = (a: number, b: number): boolean =>
+    heap[a].score < heap[b].score || (heap[a].score === heap[b].score && heap[a].order > heap[b].order);
+
+  const siftDown = (index: number): void => {
+    const size = heap.length;
+    while (true) {
+      const left = index * 2 + 1;
+      const right = left + 1;
+      let weakest = index;
+      if (left < size && weaker(left, weakest)) weakest = left;
+      if (right < size && weaker(right, weakest)) weakest = right;
+      if (weakest === index) return;
+      [heap[index], heap[weakest]] = [heap[weakest], heap[index]];
+      index = weakest;
+    }
+  };
+
+  let order = 0;
+  for (const item of items) {
+    const itemScore = score(item);
+    if (heap.length < k) {
+      heap.push({ item, score: itemScore, order: order++ });
+      let index = heap.length - 1;
+      while (index > 0) {
+        const parent = (index - 1) >> 1;
+        if (!weaker(index, parent)) break;
+        [heap[index], heap[parent]] = [heap[parent], heap[index]];
+        index = parent;
+      }
+    } else {
+      // A later item only displaces the root with a strictly higher score
+      if (itemScore > heap[0].score) {
+        heap[0] = { item, score: itemScore, order };
+        siftDown(0);
+      }
+      order++;
+    }
+  }
+
+  return heap
+    .sort((a, b) => b.score - a.score || a.order - b.order)
+    .map(entry => entry.item);
+}
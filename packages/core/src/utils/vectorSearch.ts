@@ -0,0 +1,21 @@
+/**
+ * @file Vector search tuning helpers for Universal AI Brain
+ *
+ * Atlas Vector Search scores every candidate its HNSW walk collects, so the
+ * candidate pool should scale with the results requested instead of using a
+ * large fixed floor that small searches pay for on every query.
+ */
+
+// Atlas guidance: 10-20 candidates per requested result keeps recall high
+const CANDIDATES_PER_RESULT = 15;
+const MIN_NUM_CANDIDATES = 20;
+// Largest numCandidates $vectorSearch accepts
+const MAX_NUM_CANDIDATES = 10000;
+
+/**
+ * numCandidates for a search that returns `limit` results to the caller
+ * (stages fetching extra hits for fusion or filtering stay within this pool)
+ */
+export function numCandidatesFor(limit: number): number {
+  return Math.min(Math.max(limit * CANDIDATES_PER_RESULT, MIN_NUM_CANDIDATES), MAX_NUM_CANDIDATES);
+}
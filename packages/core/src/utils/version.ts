@@ -0,0 +1,31 @@
+/**
+ * @file Version utilities for Universal AI Brain
+ *
+ * Parses dotted version strings into numeric tuples so minimum-version checks
+ * are a single tuple comparison instead of hand-rolled major/minor conditions.
+ */
+
+export type VersionTuple = [number, number, number];
+
+/**
+ * Parse a version string such as "8.1.0" or "8.0.4-rc1" into [major, minor, patch]
+ */
+export function parseVersion(version: string): VersionTuple {
+  const [major = 0, minor = 0, patch = 0] = version
+    .split('.')
+    .map(part => parseInt(part, 10) || 0);
+  return [major, minor, patch];
+}
+
+/**
+ * Check whether a version is at or above a minimum version
+ */
+export function isVersionAtLeast(version: string | VersionTuple, minimum: VersionTuple): boolean {
+  const parsed = typeof version === 'string' ? parseVersion(version) : version;
+  for (let i = 0; i < minimum.length; i++) {
+    if (parsed[i] !== minimum[i]) {
+      return parsed[i] > minimum[i];
+    }
+  }
+  return true;
+}
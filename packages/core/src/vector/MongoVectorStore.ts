@@ -12,8 +12,9 @@
  * - Error handling and fallbacks
  */
 
-import { Collection, Db, ObjectId, Document } from 'mongodb';
+import { Binary, Collection, Db, ObjectId, Document, IndexDescription } from 'mongodb';
 import { MongoConnection } from '../persistance/MongoConnection';
+import { numCandidatesFor } from '../utils/vectorSearch';
 
 export interface VectorDocument {
   _id?: ObjectId;
@@ -27,6 +28,14 @@ export interface VectorDocument {
   tokenCount?: number;
 }
 
+/**
+ * How embeddings are written to MongoDB:
+ * - 'array': BSON array of doubles (default, readable by every tool)
+ * - 'float32': packed BSON binary vector (subtype 9), roughly a third of the size
+ * - 'int8': scalar-quantized BSON binary vector for unit-range embeddings, a quarter of 'float32'
+ */
+export type VectorEncoding = 'array' | 'float32' | 'int8';
+
 export interface VectorSearchOptions {
   limit?: number;
   numCandidates?: number;
@@ -35,6 +44,8 @@ export interface VectorSearchOptions {
   index?: string;
   includeEmbeddings?: boolean;
   searchType?: 'vector' | 'hybrid' | 'text';
+  /** How hybrid search combines its branches: reciprocal rank fusion (default) or relative score fusion */
+  fusionMethod?: 'rrf' | 'rsf';
 }
 
 export interface VectorSearchResult extends VectorDocument {
@@ -57,10 +68,89 @@ export interface VectorIndexDefinition {
 
 export interface EmbeddingProvider {
   generateEmbedding(text: string): Promise<number[]>;
+  generateEmbeddings?(texts: string[]): Promise<number[][]>;
   getDimensions(): number;
   getModel(): string;
 }
 
+// Reciprocal rank fusion constant (MongoDB's $rankFusion default) and branch weights
+const RRF_RANK_CONSTANT = 60;
+const HYBRID_VECTOR_WEIGHT = 0.7;
+const HYBRID_TEXT_WEIGHT = 0.3;
+
+/**
+ * Stages that turn one hybrid search branch's hits into weighted fusion scores.
+ *
+ * Expects the branch's hits in rank order, each carrying `_id` and `rawScore`,
+ * and emits `{ _id, [scoreField] }`. RRF numbers the hits by rank; RSF rescales
+ * raw scores by the branch's min and max (a lone hit scores 1).
+ */
+export function fusionScoreStages(fusionMethod: 'rrf' | 'rsf', scoreField: string, weight: number): Document[] {
+  if (fusionMethod === 'rsf') {
+    return [
+      {
+        $group: {
+          _id: null,
+          hits: { $push: { _id: '$_id', raw: '$rawScore' } },
+          min: { $min: '$rawScore' },
+          max: { $max: '$rawScore' }
+        }
+      },
+      { $unwind: '$hits' },
+      {
+        $project: {
+          _id: '$hits._id',
+          [scoreField]: {
+            $multiply: [
+              weight,
+              {
+                $cond: [
+                  { $gt: ['$max', '$min'] },
+                  { $divide: [{ $subtract: ['$hits.raw', '$min'] }, { $subtract: ['$max', '$min'] }] },
+                  1
+                ]
+              }
+            ]
+          }
+        }
+      }
+    ];
+  }
+
+  return [
+    { $group: { _id: null, ids: { $push: '$_id' } } },
+    { $unwind: { path: '$ids', includeArrayIndex: 'rank' } },
+    {
+      $project: {
+        _id: '$ids',
+        [scoreField]: { $divide: [weight, { $add: ['$rank', RRF_RANK_CONSTANT + 1] }] }
+      }
+    }
+  ];
+}
+
+/**
+ * Stages that sum the vector and text fusion scores per document and sort by
+ * the combined `score`; a branch that missed a document leaves its score null
+ */
+export function fusionCombineStages(): Document[] {
+  return [
+    {
+      $group: {
+        _id: '$_id',
+        vectorScore: { $max: '$vectorScore' },
+        textScore: { $max: '$textScore' }
+      }
+    },
+    {
+      $addFields: {
+        score: { $add: [{ $ifNull: ['$vectorScore', 0] }, { $ifNull: ['$textScore', 0] }] }
+      }
+    },
+    { $sort: { score: -1 } }
+  ];
+}
+
 /**
  * MongoVectorStore - Production-ready MongoDB Atlas Vector Search implementation
  * 
@@ -74,17 +164,20 @@ export class MongoVectorStore {
   private textIndexName: string;
   private embeddingProvider: EmbeddingProvider | null = null;
   private isInitialized: boolean = false;
+  private vectorEncoding: VectorEncoding;
 
   constructor(
     mongoConnection: MongoConnection,
     collectionName: string = 'embedded_content',
     vectorIndexName: string = 'vector_index',
-    textIndexName: string = 'text_index'
+    textIndexName: string = 'text_index',
+    vectorEncoding: VectorEncoding = 'array'
   ) {
     this.db = mongoConnection.getDb();
     this.collection = this.db.collection<VectorDocument>(collectionName);
     this.vectorIndexName = vectorIndexName;
     this.textIndexName = textIndexName;
+    this.vectorEncoding = vectorEncoding;
   }
 
   /**
@@ -121,7 +214,7 @@ export class MongoVectorStore {
 
       const document: VectorDocument = {
         text,
-        embedding: vectorEmbedding,
+        embedding: this.encodeEmbedding(vectorEmbedding),
         metadata: {
           ...metadata,
           indexed_at: new Date()
@@ -153,21 +246,21 @@ export class MongoVectorStore {
     this.ensureInitialized();
 
     try {
-      const vectorDocuments: VectorDocument[] = await Promise.all(
-        documents.map(async (doc) => ({
-          text: doc.text,
-          embedding: doc.embedding || await this.generateEmbedding(doc.text),
-          metadata: {
-            ...doc.metadata,
-            indexed_at: new Date()
-          },
-          source: doc.source || 'unknown',
-          timestamp: new Date(),
-          tokenCount: this.estimateTokenCount(doc.text)
-        }))
-      );
+      const embeddings = await this.generateMissingEmbeddings(documents);
+      const vectorDocuments: VectorDocument[] = documents.map((doc, index) => ({
+        text: doc.text,
+        embedding: this.encodeEmbedding(embeddings[index]),
+        metadata: {
+          ...doc.metadata,
+          indexed_at: new Date()
+        },
+        source: doc.source || 'unknown',
+        timestamp: new Date(),
+        tokenCount: this.estimateTokenCount(doc.text)
+      }));
 
-      const result = await this.collection.insertMany(vectorDocuments);
+      // Documents are independent, so let the server apply them unordered
+      const result = await this.collection.insertMany(vectorDocuments, { ordered: false });
       return Object.values(result.insertedIds).map(id => id.toString());
     } catch (error) {
       console.error('Error storing documents:', error);
@@ -187,7 +280,7 @@ export class MongoVectorStore {
 
     const {
       limit = 10,
-      numCandidates = 50,
+      numCandidates = numCandidatesFor(limit),
       filter = {},
       minScore = 0.7,
       index = this.vectorIndexName
@@ -203,7 +296,7 @@ export class MongoVectorStore {
         {
           $vectorSearch: {
             index,
-            queryVector: queryEmbedding,
+            queryVector: this.encodeEmbedding(queryEmbedding),
             path: "embedding",
             filter,
             limit,
@@ -224,9 +317,9 @@ export class MongoVectorStore {
         }
       ];
 
-      // Add projection to exclude embeddings if not needed
+      // Drop embeddings straight after the search stage so later stages don't carry them
       if (!options.includeEmbeddings) {
-        (pipeline as any[]).push({
+        (pipeline as any[]).splice(1, 0, {
           $project: {
             embedding: 0
           }
@@ -234,7 +327,7 @@ export class MongoVectorStore {
       }
 
       const results = await this.collection.aggregate<VectorSearchResult>(pipeline).toArray();
-      return results;
+      return options.includeEmbeddings ? results.map(result => this.decodeEmbedding(result)) : results;
     } catch (error) {
       console.error('Error in vector search:', error);
       throw new Error(`Vector search failed: ${error instanceof Error ? error.message : String(error)}`);
@@ -244,6 +337,10 @@ export class MongoVectorStore {
   /**
    * Hybrid search combining vector search with text search
    * Essential for production RAG applications
+   *
+   * Results are fused server-side. Reciprocal rank fusion (the default) scores
+   * rank positions; relative score fusion ('rsf') min-max normalizes each
+   * branch's raw scores to [0, 1] so score magnitudes carry into the ranking.
    */
   async hybridSearch(
     query: string,
@@ -251,49 +348,100 @@ export class MongoVectorStore {
   ): Promise<VectorSearchResult[]> {
     this.ensureInitialized();
 
-    try {
-      // Get vector search results
-      const vectorResults = await this.vectorSearch(query, {
-        ...options,
-        searchType: 'vector'
-      });
+    const {
+      limit = 10,
+      numCandidates = numCandidatesFor(limit),
+      filter = {},
+      fusionMethod = 'rrf'
+    } = options;
+    const candidateLimit = limit * 2;
 
-      // Get text search results
-      const textResults = await this.textSearch(query, options);
-
-      // Merge and deduplicate results
-      const combinedResults = new Map<string, VectorSearchResult>();
-      
-      // Add vector results with higher weight (0.7)
-      vectorResults.forEach(result => {
-        const id = result._id!.toString();
-        combinedResults.set(id, { 
-          ...result, 
-          score: result.score * 0.7,
-          metadata: { ...result.metadata, searchType: 'vector' }
-        });
-      });
+    // Each branch carries only _id and its raw score until the final page is known
+    const branchStages = (scoreField: string, weight: number, scoreMeta: string): Document[] => [
+      { $project: { _id: 1, rawScore: { $meta: scoreMeta } } },
+      ...fusionScoreStages(fusionMethod, scoreField, weight)
+    ];
 
-      // Add text results with lower weight (0.3)
-      textResults.forEach(result => {
-        const id = result._id!.toString();
-        if (!combinedResults.has(id)) {
-          combinedResults.set(id, { 
-            ...result, 
-            score: result.score * 0.3,
-            metadata: { ...result.metadata, searchType: 'text' }
-          });
-        } else {
-          // Boost score for documents found in both searches
-          const existing = combinedResults.get(id)!;
-          existing.score = Math.min(existing.score + (result.score * 0.3), 1.0);
-          existing.metadata.searchType = 'hybrid';
+    try {
+      const queryEmbedding = await this.generateEmbedding(query);
+
+      // Fuse both searches with the chosen fusion method in a single aggregation:
+      // the text branch joins through $unionWith, scores are summed per _id on
+      // the server, and full documents are looked up for the top results only
+      const pipeline: Document[] = [
+        {
+          $vectorSearch: {
+            index: this.vectorIndexName,
+            queryVector: this.encodeEmbedding(queryEmbedding),
+            path: 'embedding',
+            filter,
+            limit: candidateLimit,
+            numCandidates: Math.max(numCandidates, candidateLimit)
+          }
+        },
+        ...branchStages('vectorScore', HYBRID_VECTOR_WEIGHT, 'vectorSearchScore'),
+        {
+          $unionWith: {
+            coll: this.collection.collectionName,
+            pipeline: [
+              {
+                $search: {
+                  index: this.textIndexName,
+                  text: {
+                    query,
+                    path: ['text', 'metadata.title', 'metadata.description']
+                  }
+                }
+              },
+              ...(Object.keys(filter).length > 0 ? [{ $match: filter }] : []),
+              { $limit: candidateLimit },
+              ...branchStages('textScore', HYBRID_TEXT_WEIGHT, 'searchScore')
+            ]
+          }
+        },
+        ...fusionCombineStages(),
+        { $limit: limit },
+        {
+          $lookup: {
+            from: this.collection.collectionName,
+            localField: '_id',
+            foreignField: '_id',
+            as: 'document',
+            ...(!options.includeEmbeddings && { pipeline: [{ $project: { embedding: 0 } }] })
+          }
+        },
+        { $unwind: '$document' },
+        {
+          $replaceRoot: {
+            newRoot: {
+              $mergeObjects: [
+                '$document',
+                {
+                  score: '$score',
+                  metadata: {
+                    $mergeObjects: [
+                      '$document.metadata',
+                      {
+                        searchType: {
+                          // A branch that missed the document leaves its score null
+                          $cond: [
+                            { $and: [{ $ne: ['$vectorScore', null] }, { $ne: ['$textScore', null] }] },
+                            'hybrid',
+                            { $cond: [{ $ne: ['$vectorScore', null] }, 'vector', 'text'] }
+                          ]
+                        }
+                      }
+                    ]
+                  }
+                }
+              ]
+            }
+          }
         }
-      });
+      ];
 
-      return Array.from(combinedResults.values())
-        .sort((a, b) => b.score - a.score)
-        .slice(0, options.limit || 10);
+      const results = await this.collection.aggregate<VectorSearchResult>(pipeline).toArray();
+      return options.includeEmbeddings ? results.map(result => this.decodeEmbedding(result)) : results;
     } catch (error) {
       console.error('Error in hybrid search:', error);
       // Fallback to vector search only
@@ -333,8 +481,13 @@ export class MongoVectorStore {
         (pipeline as any[]).splice(1, 0, { $match: options.filter });
       }
 
+      // Text hits feed the hybrid merge, which never needs the stored vectors
+      if (!options.includeEmbeddings) {
+        (pipeline as any[]).splice(1, 0, { $project: { embedding: 0 } });
+      }
+
       const results = await this.collection.aggregate<VectorSearchResult>(pipeline).toArray();
-      return results;
+      return options.includeEmbeddings ? results.map(result => this.decodeEmbedding(result)) : results;
     } catch (error) {
       console.warn('Text search failed, this is normal if text index is not created:', error instanceof Error ? error.message : String(error));
       return [];
@@ -358,7 +511,7 @@ export class MongoVectorStore {
       }
 
       // Search for similar documents
-      return this.vectorSearch(document.embedding, {
+      return this.vectorSearch(this.decodeEmbedding(document).embedding, {
         ...options,
         filter: {
           _id: { $ne: new ObjectId(documentId) }, // Exclude the original document
@@ -385,6 +538,74 @@ export class MongoVectorStore {
     return this.embeddingProvider.generateEmbedding(text);
   }
 
+  /**
+   * Resolve an embedding for every document, generating the missing ones
+   * in a single batched provider call when the provider supports it
+   */
+  private async generateMissingEmbeddings(
+    documents: Array<{ text: string; embedding?: number[] }>
+  ): Promise<number[][]> {
+    const missing = documents
+      .map((doc, index) => (doc.embedding ? -1 : index))
+      .filter(index => index !== -1);
+    const embeddings = documents.map(doc => doc.embedding as number[]);
+    if (missing.length === 0) {
+      return embeddings;
+    }
+
+    const texts = missing.map(index => documents[index].text);
+    // Batch providers drop blank texts, which would shift every later vector
+    // onto the wrong document - reject them up front as generateEmbedding does
+    if (texts.some(text => !text || text.trim().length === 0)) {
+      throw new Error('Text cannot be empty');
+    }
+
+    const generated = this.embeddingProvider!.generateEmbeddings
+      ? await this.embeddingProvider!.generateEmbeddings(texts)
+      : await Promise.all(texts.map(text => this.generateEmbedding(text)));
+    if (generated.length !== texts.length) {
+      throw new Error(`Embedding provider returned ${generated.length} embeddings for ${texts.length} texts`);
+    }
+
+    missing.forEach((documentIndex, i) => {
+      embeddings[documentIndex] = generated[i];
+    });
+    return embeddings;
+  }
+
+  /**
+   * Convert an embedding to its stored representation
+   */
+  private encodeEmbedding(embedding: number[]): number[] {
+    // Stored as a BSON vector; the public type stays number[] and is restored on read
+    if (this.vectorEncoding === 'float32') {
+      return Binary.fromFloat32Array(Float32Array.from(embedding)) as unknown as number[];
+    }
+    if (this.vectorEncoding === 'int8') {
+      const quantized = new Int8Array(embedding.length);
+      for (let i = 0; i < embedding.length; i++) {
+        quantized[i] = Math.max(-127, Math.min(127, Math.round(embedding[i] * 127)));
+      }
+      return Binary.fromInt8Array(quantized) as unknown as number[];
+    }
+    return embedding;
+  }
+
+  /**
+   * Restore a document's embedding to number[] if it was stored as a BSON vector
+   */
+  private decodeEmbedding<D extends VectorDocument>(document: D): D {
+    const embedding = document.embedding as unknown;
+    if (embedding instanceof Binary) {
+      // The first byte of a BSON vector records its element type
+      const values = embedding.buffer[0] === Binary.VECTOR_TYPE.Int8
+        ? Array.from(embedding.toInt8Array(), value => value / 127)
+        : Array.from(embedding.toFloat32Array());
+      return { ...document, embedding: values };
+    }
+    return document;
+  }
+
   private estimateTokenCount(text: string): number {
     // Rough estimation: ~4 characters per token
     return Math.ceil(text.length / 4);
@@ -392,23 +613,33 @@ export class MongoVectorStore {
 
   private async ensureIndexes(): Promise<void> {
     try {
-      // Create text search index for hybrid search
-      await this.collection.createIndex(
-        {
-          text: "text",
-          "metadata.title": "text",
-          "metadata.description": "text"
-        },
+      const indexes: IndexDescription[] = [
+        // Text search index for hybrid search
         {
+          key: {
+            text: "text",
+            "metadata.title": "text",
+            "metadata.description": "text"
+          },
           name: this.textIndexName,
           background: true
-        }
-      );
+        },
+        // Compound indexes for filtering
+        { key: { source: 1, timestamp: -1 }, name: 'source_1_timestamp_-1' },
+        { key: { "metadata.type": 1 }, name: 'metadata.type_1' },
+        { key: { timestamp: -1 }, name: 'timestamp_-1' }
+      ];
 
-      // Create compound indexes for filtering
-      await this.collection.createIndex({ source: 1, timestamp: -1 });
-      await this.collection.createIndex({ "metadata.type": 1 });
-      await this.collection.createIndex({ timestamp: -1 });
+      // Only build what isn't there yet - repeat initializations become a single listIndexes
+      const existing = await this.getExistingIndexNames();
+      const missing = indexes.filter(index => !existing.has(index.name!));
+      if (missing.length === 0) {
+        return;
+      }
+
+      // One createIndexes command builds them all in a single round trip and
+      // a single pass over the collection
+      await this.collection.createIndexes(missing);
 
       console.log('✅ MongoDB indexes created successfully');
     } catch (error) {
@@ -416,11 +647,34 @@ export class MongoVectorStore {
     }
   }
 
+  /**
+   * Names of the indexes already on the collection (empty if it doesn't exist yet)
+   */
+  private async getExistingIndexNames(): Promise<Set<string>> {
+    try {
+      const indexes = await this.collection.listIndexes().toArray();
+      return new Set(indexes.map(index => index.name as string));
+    } catch {
+      return new Set();
+    }
+  }
+
   /**
    * Create vector search index definition for Atlas
    * This needs to be created in Atlas UI or via Atlas CLI
+   *
+   * Float embeddings are scalar-quantized by Atlas so scoring runs on int8
+   * values; int8-encoded embeddings are already quantized and indexed as-is.
+   * 'dotProduct' ranks identically to cosine without the norm terms, but only
+   * when every stored and query vector is a unit-length float embedding (as
+   * OpenAI and Voyage AI return). It is not valid for caller-supplied vectors
+   * of other norms or for 'int8' encoding, whose stored values are rescaled.
    */
-  getVectorIndexDefinition(dimensions: number = 1536): VectorIndexDefinition {
+  getVectorIndexDefinition(
+    dimensions: number = 1536,
+    quantization: 'none' | 'scalar' | 'binary' = 'scalar',
+    similarity: 'euclidean' | 'cosine' | 'dotProduct' = 'cosine'
+  ): VectorIndexDefinition {
     return {
       name: this.vectorIndexName,
       type: 'vectorSearch',
@@ -430,7 +684,8 @@ export class MongoVectorStore {
             type: 'vector',
             path: 'embedding',
             numDimensions: dimensions,
-            similarity: 'cosine'
+            similarity,
+            ...(this.vectorEncoding !== 'int8' && quantization !== 'none' ? { quantization } : {})
           },
           {
             type: 'filter',
@@ -455,7 +710,7 @@ export class MongoVectorStore {
   async getStats(): Promise<any> {
     try {
       const [count, sampleDoc] = await Promise.all([
-        this.collection.countDocuments(),
+        this.collection.estimatedDocumentCount(),
         this.collection.findOne({}, { projection: { embedding: 0 } })
       ]);
 
@@ -521,10 +776,11 @@ export class MongoVectorStore {
   async getDocument(documentId: string, includeEmbedding: boolean = false): Promise<VectorDocument | null> {
     try {
       const projection = includeEmbedding ? {} : { embedding: 0 };
-      return await this.collection.findOne(
+      const document = await this.collection.findOne(
         { _id: new ObjectId(documentId) },
         { projection }
       );
+      return document && includeEmbedding ? this.decodeEmbedding(document) : document;
     } catch (error) {
       console.error('Error getting document:', error);
       return null;
@@ -593,7 +849,11 @@ export class MongoVectorStore {
   async healthCheck(): Promise<{ isHealthy: boolean; details: any }> {
     try {
       const stats = await this.getStats();
-      const testQuery = await this.vectorSearch('test query', { limit: 1 });
+
+      // Embed the probe live on every check so an expired key or provider
+      // outage is reported; the same vector then exercises vector search
+      const probeEmbedding = await this.generateEmbedding('test query');
+      const testQuery = await this.vectorSearch(probeEmbedding, { limit: 1 });
 
       return {
         isHealthy: true,
@@ -12,6 +12,7 @@
 
 import dotenv from 'dotenv';
 import { MongoClient } from 'mongodb';
+import { mongoClientOptions } from './mongoClientOptions.js';
 import { openai } from '@ai-sdk/openai';
 
 dotenv.config();
@@ -22,7 +23,7 @@ console.log('🎯 Comparing: Basic AI vs AI Brain with 24 Cognitive Systems');
 console.log('📊 Using REAL data and REAL responses');
 console.log('');
 
-const mongoClient = new MongoClient(process.env.MONGODB_URI);
+const mongoClient = new MongoClient(process.env.MONGODB_URI, mongoClientOptions);
 
 // Test scenarios that showcase cognitive capabilities
 const testScenarios = [
@@ -13,6 +13,7 @@
 
 import dotenv from 'dotenv';
 import { MongoClient } from 'mongodb';
+import { mongoClientOptions } from './mongoClientOptions.js';
 
 dotenv.config();
 
@@ -22,7 +23,7 @@ console.log('🎯 Testing: ALL 24 COGNITIVE SYSTEMS WORKING TOGETHER');
 console.log('📊 Using REAL data from ALL cognitive system collections');
 console.log('');
 
-const mongoClient = new MongoClient(process.env.MONGODB_URI);
+const mongoClient = new MongoClient(process.env.MONGODB_URI, mongoClientOptions);
 
 // All 24 cognitive systems
 const allCognitiveSystems = [
@@ -2,15 +2,12 @@ import { Agent } from '@mastra/core/agent';
 import { openai } from '@ai-sdk/openai';
 import { createTool } from '@mastra/core/tools';
 import { z } from 'zod';
-import { MongoClient } from 'mongodb';
+import { getTestDb } from '../testDb';
 
 // Load environment variables
 import dotenv from 'dotenv';
 dotenv.config();
 
-// MongoDB connection for real data operations
-const mongoClient = new MongoClient(process.env.MONGODB_URI!);
-
 // Tool for writing real test data to MongoDB
 const writeTestDataTool = createTool({
   id: 'write-test-data',
@@ -22,8 +19,7 @@ const writeTestDataTool = createTool({
   }),
   execute: async ({ context }) => {
     try {
-      await mongoClient.connect();
-      const db = mongoClient.db(process.env.TEST_DATABASE_NAME);
+      const db = await getTestDb();
       const collection = db.collection(`${process.env.TEST_COLLECTION_PREFIX}${context.collection}`);
       
       const document = {
@@ -62,8 +58,7 @@ const analyzeTestDataTool = createTool({
   }),
   execute: async ({ context }) => {
     try {
-      await mongoClient.connect();
-      const db = mongoClient.db(process.env.TEST_DATABASE_NAME);
+      const db = await getTestDb();
       const collection = db.collection(`${process.env.TEST_COLLECTION_PREFIX}${context.collection}`);
       
       const query = {
@@ -107,8 +102,7 @@ const hybridSearchTool = createTool({
   }),
   execute: async ({ context }) => {
     try {
-      await mongoClient.connect();
-      const db = mongoClient.db(process.env.TEST_DATABASE_NAME);
+      const db = await getTestDb();
       const collection = db.collection(`${process.env.TEST_COLLECTION_PREFIX}${context.collection}`);
       
       // MongoDB $rankFusion hybrid search pipeline
@@ -2,13 +2,11 @@ import { Agent } from '@mastra/core/agent';
 import { openai } from '@ai-sdk/openai';
 import { createTool } from '@mastra/core/tools';
 import { z } from 'zod';
-import { MongoClient } from 'mongodb';
+import { getTestDb } from '../testDb';
 import dotenv from 'dotenv';
 
 dotenv.config();
 
-const mongoClient = new MongoClient(process.env.MONGODB_URI!);
-
 // Tool for testing Working Memory with real data
 const testWorkingMemoryTool = createTool({
   id: 'test-working-memory',
@@ -20,8 +18,7 @@ const testWorkingMemoryTool = createTool({
   }),
   execute: async ({ context }) => {
     try {
-      await mongoClient.connect();
-      const db = mongoClient.db(process.env.TEST_DATABASE_NAME);
+      const db = await getTestDb();
       const collection = db.collection('test_working_memory');
       
       const workingMemoryData = {
@@ -69,8 +66,7 @@ const testEpisodicMemoryTool = createTool({
   }),
   execute: async ({ context }) => {
     try {
-      await mongoClient.connect();
-      const db = mongoClient.db(process.env.TEST_DATABASE_NAME);
+      const db = await getTestDb();
       const collection = db.collection('test_episodic_memory');
       
       const episodicData = {
@@ -127,8 +123,7 @@ const testSemanticMemoryTool = createTool({
   }),
   execute: async ({ context }) => {
     try {
-      await mongoClient.connect();
-      const db = mongoClient.db(process.env.TEST_DATABASE_NAME);
+      const db = await getTestDb();
       const collection = db.collection('test_semantic_memory');
       
       const semanticData = {
@@ -181,8 +176,7 @@ const testMemoryDecayTool = createTool({
   }),
   execute: async ({ context }) => {
     try {
-      await mongoClient.connect();
-      const db = mongoClient.db(process.env.TEST_DATABASE_NAME);
+      const db = await getTestDb();
       const collection = db.collection('test_memory_decay');
       
       // Calculate decay factor based on time and access frequency
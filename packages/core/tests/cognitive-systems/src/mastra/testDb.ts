@@ -0,0 +1,26 @@
+import { MongoClient } from 'mongodb';
+import dotenv from 'dotenv';
+import { mongoClientOptions } from '../mongoClientOptions.js';
+
+// Imports are evaluated before the agents' own dotenv.config() calls
+dotenv.config();
+
+const mongoClient = new MongoClient(process.env.MONGODB_URI!, mongoClientOptions);
+
+// One client and database handle shared by every agent's tool calls. The
+// connection is opened (and warmed with a ping) once, instead of on every execution.
+const testDb = mongoClient.db(process.env.TEST_DATABASE_NAME);
+let connection: Promise<unknown> | null = null;
+
+export async function getTestDb() {
+  if (!connection) {
+    connection = mongoClient.connect().then(() => testDb.command({ ping: 1 }));
+  }
+  try {
+    await connection;
+  } catch (error) {
+    connection = null;
+    throw error;
+  }
+  return testDb;
+}
@@ -13,6 +13,7 @@
 
 import dotenv from 'dotenv';
 import { MongoClient } from 'mongodb';
+import { mongoClientOptions } from './mongoClientOptions.js';
 
 dotenv.config();
 
@@ -22,7 +23,7 @@ console.log('🎯 Testing: How AI Brain USES stored memories vs Basic AI');
 console.log('📊 Using REAL stored data from previous tests');
 console.log('');
 
-const mongoClient = new MongoClient(process.env.MONGODB_URI);
+const mongoClient = new MongoClient(process.env.MONGODB_URI, mongoClientOptions);
 
 // Retrieve stored memories from MongoDB
 async function retrieveStoredMemories() {
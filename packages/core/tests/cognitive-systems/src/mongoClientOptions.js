@@ -0,0 +1,8 @@
+// MongoClient options shared by the cognitive-system scripts and agents.
+// zlib is built into Node, so wire compression needs no extra native module.
+
+/** @type {import('mongodb').MongoClientOptions} */
+export const mongoClientOptions = {
+  compressors: ['zlib'],
+  zlibCompressionLevel: 6
+};
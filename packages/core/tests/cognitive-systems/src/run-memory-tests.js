@@ -7,6 +7,7 @@
 
 import dotenv from 'dotenv';
 import { MongoClient } from 'mongodb';
+import { mongoClientOptions } from './mongoClientOptions.js';
 import { openai } from '@ai-sdk/openai';
 import { Agent } from '@mastra/core/agent';
 import { createTool } from '@mastra/core/tools';
@@ -20,12 +21,12 @@ console.log('📊 Testing memory systems with REAL MongoDB data');
 console.log('🔗 MongoDB:', process.env.MONGODB_URI ? '✅ Connected' : '❌ Not configured');
 console.log('');
 
-const mongoClient = new MongoClient(process.env.MONGODB_URI);
+const mongoClient = new MongoClient(process.env.MONGODB_URI, mongoClientOptions);
 
 // Test Working Memory System
-async function testWorkingMemory() {
-  console.log('🧠 Testing WORKING MEMORY System');
-  console.log('─'.repeat(40));
+async function testWorkingMemory(log = console.log) {
+  log('🧠 Testing WORKING MEMORY System');
+  log('─'.repeat(40));
   
   try {
     await mongoClient.connect();
@@ -49,41 +50,44 @@ async function testWorkingMemory() {
     };
     
     // Write real data to MongoDB
-    console.log('📝 Writing working memory data to MongoDB...');
+    log('📝 Writing working memory data to MongoDB...');
     const result = await collection.insertOne(testData);
-    console.log(`✅ Data written - ID: ${result.insertedId}`);
+    log(`✅ Data written - ID: ${result.insertedId}`);
     
     // Immediately retrieve and analyze
-    console.log('🔍 Retrieving and analyzing data...');
+    log('🔍 Retrieving and analyzing data...');
     const retrieved = await collection.findOne({ _id: result.insertedId });
+    const { activeItems, capacity, task } = retrieved;
     
     // Calculate working memory metrics
-    const memoryLoad = retrieved.activeItems.length / retrieved.capacity;
+    const memoryLoad = activeItems.length / capacity;
     const isOverloaded = memoryLoad > 1.0;
     
-    console.log('📊 WORKING MEMORY ANALYSIS:');
-    console.log(`   Active Items: ${retrieved.activeItems.length}`);
-    console.log(`   Capacity: ${retrieved.capacity}`);
-    console.log(`   Memory Load: ${(memoryLoad * 100).toFixed(1)}%`);
-    console.log(`   Overloaded: ${isOverloaded ? '❌ YES' : '✅ NO'}`);
-    console.log(`   Task: ${retrieved.task}`);
+    log([
+      '📊 WORKING MEMORY ANALYSIS:',
+      `   Active Items: ${activeItems.length}`,
+      `   Capacity: ${capacity}`,
+      `   Memory Load: ${(memoryLoad * 100).toFixed(1)}%`,
+      `   Overloaded: ${isOverloaded ? '❌ YES' : '✅ NO'}`,
+      `   Task: ${task}`
+    ].join('\n'));
     
     return {
       system: 'working_memory',
       status: 'PASSED',
-      metrics: { memoryLoad, isOverloaded, activeItems: retrieved.activeItems.length }
+      metrics: { memoryLoad, isOverloaded, activeItems: activeItems.length }
     };
     
   } catch (error) {
-    console.log(`❌ Working Memory test failed: ${error.message}`);
+    log(`❌ Working Memory test failed: ${error.message}`);
     return { system: 'working_memory', status: 'FAILED', error: error.message };
   }
 }
 
 // Test Episodic Memory System
-async function testEpisodicMemory() {
-  console.log('\n🧠 Testing EPISODIC MEMORY System');
-  console.log('─'.repeat(40));
+async function testEpisodicMemory(log = console.log) {
+  log('\n🧠 Testing EPISODIC MEMORY System');
+  log('─'.repeat(40));
   
   try {
     await mongoClient.connect();
@@ -104,51 +108,54 @@ async function testEpisodicMemory() {
     };
     
     // Write real data to MongoDB
-    console.log('📝 Writing episodic memory data to MongoDB...');
+    log('📝 Writing episodic memory data to MongoDB...');
     const result = await collection.insertOne(testData);
-    console.log(`✅ Data written - ID: ${result.insertedId}`);
+    log(`✅ Data written - ID: ${result.insertedId}`);
     
     // Immediately retrieve and analyze
-    console.log('🔍 Retrieving and analyzing data...');
+    log('🔍 Retrieving and analyzing data...');
     const retrieved = await collection.findOne({ _id: result.insertedId });
+    const { event, context, emotions, participants, significance } = retrieved;
     
     // Test memory association by finding similar events
     const similarEvents = await collection.find({
       $or: [
-        { context: retrieved.context },
-        { emotions: { $in: retrieved.emotions } },
-        { significance: retrieved.significance }
+        { context },
+        { emotions: { $in: emotions } },
+        { significance }
       ]
     }).limit(5).toArray();
     
-    console.log('📊 EPISODIC MEMORY ANALYSIS:');
-    console.log(`   Event: ${retrieved.event}`);
-    console.log(`   Context: ${retrieved.context}`);
-    console.log(`   Emotions: ${retrieved.emotions.join(', ')}`);
-    console.log(`   Participants: ${retrieved.participants.length}`);
-    console.log(`   Similar Events Found: ${similarEvents.length}`);
-    console.log(`   Significance: ${retrieved.significance}`);
+    log([
+      '📊 EPISODIC MEMORY ANALYSIS:',
+      `   Event: ${event}`,
+      `   Context: ${context}`,
+      `   Emotions: ${emotions.join(', ')}`,
+      `   Participants: ${participants.length}`,
+      `   Similar Events Found: ${similarEvents.length}`,
+      `   Significance: ${significance}`
+    ].join('\n'));
     
     return {
       system: 'episodic_memory',
       status: 'PASSED',
       metrics: { 
-        emotionsCount: retrieved.emotions.length,
-        participantsCount: retrieved.participants.length,
+        emotionsCount: emotions.length,
+        participantsCount: participants.length,
         similarEventsFound: similarEvents.length
       }
     };
     
   } catch (error) {
-    console.log(`❌ Episodic Memory test failed: ${error.message}`);
+    log(`❌ Episodic Memory test failed: ${error.message}`);
     return { system: 'episodic_memory', status: 'FAILED', error: error.message };
   }
 }
 
 // Test Semantic Memory System
-async function testSemanticMemory() {
-  console.log('\n🧠 Testing SEMANTIC MEMORY System');
-  console.log('─'.repeat(40));
+async function testSemanticMemory(log = console.log) {
+  log('\n🧠 Testing SEMANTIC MEMORY System');
+  log('─'.repeat(40));
   
   try {
     await mongoClient.connect();
@@ -169,17 +176,18 @@ async function testSemanticMemory() {
     };
     
     // Write real data to MongoDB
-    console.log('📝 Writing semantic memory data to MongoDB...');
+    log('📝 Writing semantic memory data to MongoDB...');
     const result = await collection.insertOne(testData);
-    console.log(`✅ Data written - ID: ${result.insertedId}`);
+    log(`✅ Data written - ID: ${result.insertedId}`);
     
     // Immediately retrieve and analyze
-    console.log('🔍 Retrieving and analyzing data...');
+    log('🔍 Retrieving and analyzing data...');
     const retrieved = await collection.findOne({ _id: result.insertedId });
+    const { fact, category, confidence, sources, verified } = retrieved;
     
     // Test knowledge retrieval by category
     const relatedFacts = await collection.find({
-      category: retrieved.category
+      category
     }).limit(5).toArray();
     
     // Test knowledge retrieval by confidence level
@@ -187,35 +195,37 @@ async function testSemanticMemory() {
       confidence: { $gte: 0.8 }
     }).limit(5).toArray();
     
-    console.log('📊 SEMANTIC MEMORY ANALYSIS:');
-    console.log(`   Fact: ${retrieved.fact}`);
-    console.log(`   Category: ${retrieved.category}`);
-    console.log(`   Confidence: ${(retrieved.confidence * 100).toFixed(1)}%`);
-    console.log(`   Sources: ${retrieved.sources.length}`);
-    console.log(`   Related Facts: ${relatedFacts.length}`);
-    console.log(`   High Confidence Facts: ${highConfidenceFacts.length}`);
-    console.log(`   Verified: ${retrieved.verified ? '✅ YES' : '❌ NO'}`);
+    log([
+      '📊 SEMANTIC MEMORY ANALYSIS:',
+      `   Fact: ${fact}`,
+      `   Category: ${category}`,
+      `   Confidence: ${(confidence * 100).toFixed(1)}%`,
+      `   Sources: ${sources.length}`,
+      `   Related Facts: ${relatedFacts.length}`,
+      `   High Confidence Facts: ${highConfidenceFacts.length}`,
+      `   Verified: ${verified ? '✅ YES' : '❌ NO'}`
+    ].join('\n'));
     
     return {
       system: 'semantic_memory',
       status: 'PASSED',
       metrics: { 
-        confidence: retrieved.confidence,
-        sourcesCount: retrieved.sources.length,
+        confidence,
+        sourcesCount: sources.length,
         relatedFactsFound: relatedFacts.length
       }
     };
     
   } catch (error) {
-    console.log(`❌ Semantic Memory test failed: ${error.message}`);
+    log(`❌ Semantic Memory test failed: ${error.message}`);
     return { system: 'semantic_memory', status: 'FAILED', error: error.message };
   }
 }
 
 // Test Memory Decay System
-async function testMemoryDecay() {
-  console.log('\n🧠 Testing MEMORY DECAY System');
-  console.log('─'.repeat(40));
+async function testMemoryDecay(log = console.log) {
+  log('\n🧠 Testing MEMORY DECAY System');
+  log('─'.repeat(40));
   
   try {
     await mongoClient.connect();
@@ -242,22 +252,24 @@ async function testMemoryDecay() {
     };
     
     // Write real data to MongoDB
-    console.log('📝 Writing memory decay data to MongoDB...');
+    log('📝 Writing memory decay data to MongoDB...');
     const result = await collection.insertOne(testData);
-    console.log(`✅ Data written - ID: ${result.insertedId}`);
+    log(`✅ Data written - ID: ${result.insertedId}`);
     
     // Immediately retrieve and analyze
-    console.log('🔍 Retrieving and analyzing data...');
+    log('🔍 Retrieving and analyzing data...');
     const retrieved = await collection.findOne({ _id: result.insertedId });
     
-    console.log('📊 MEMORY DECAY ANALYSIS:');
-    console.log(`   Memory ID: ${retrieved.memoryId}`);
-    console.log(`   Time Elapsed: ${retrieved.timeElapsed} hours`);
-    console.log(`   Access Frequency: ${retrieved.accessFrequency} times`);
-    console.log(`   Decay Factor: ${retrieved.decayFactor.toFixed(3)}`);
-    console.log(`   Should Decay: ${retrieved.shouldDecay ? '✅ YES' : '❌ NO'}`);
-    console.log(`   Decay Status: ${retrieved.decayStatus.toUpperCase()}`);
-    console.log(`   Algorithm: ${retrieved.decayAlgorithm}`);
+    log([
+      '📊 MEMORY DECAY ANALYSIS:',
+      `   Memory ID: ${retrieved.memoryId}`,
+      `   Time Elapsed: ${retrieved.timeElapsed} hours`,
+      `   Access Frequency: ${retrieved.accessFrequency} times`,
+      `   Decay Factor: ${retrieved.decayFactor.toFixed(3)}`,
+      `   Should Decay: ${retrieved.shouldDecay ? '✅ YES' : '❌ NO'}`,
+      `   Decay Status: ${retrieved.decayStatus.toUpperCase()}`,
+      `   Algorithm: ${retrieved.decayAlgorithm}`
+    ].join('\n'));
     
     return {
       system: 'memory_decay',
@@ -270,7 +282,7 @@ async function testMemoryDecay() {
     };
     
   } catch (error) {
-    console.log(`❌ Memory Decay test failed: ${error.message}`);
+    log(`❌ Memory Decay test failed: ${error.message}`);
     return { system: 'memory_decay', status: 'FAILED', error: error.message };
   }
 }
@@ -279,36 +291,41 @@ async function testMemoryDecay() {
 async function runMemoryTests() {
   console.log('🚀 Starting Memory Systems Testing...\n');
   
-  const results = [];
-  
-  // Run all memory system tests
-  results.push(await testWorkingMemory());
-  results.push(await testEpisodicMemory());
-  results.push(await testSemanticMemory());
-  results.push(await testMemoryDecay());
-  
-  // Generate report
-  console.log('\n' + '='.repeat(60));
-  console.log('📊 MEMORY SYSTEMS TESTING COMPLETE');
-  console.log('='.repeat(60));
+  // Each memory system uses its own collection, so the tests run concurrently.
+  // Their output is buffered and printed in order to keep the log readable.
+  const memoryTests = [testWorkingMemory, testEpisodicMemory, testSemanticMemory, testMemoryDecay];
+  const outputs = memoryTests.map(() => []);
+  const results = await Promise.all(
+    memoryTests.map((test, index) => test((...args) => outputs[index].push(args.join(' '))))
+  );
+  outputs.forEach(lines => console.log(lines.join('\n')));
   
+  // Generate report - collected and written in one go
   const passed = results.filter(r => r.status === 'PASSED').length;
   const failed = results.filter(r => r.status === 'FAILED').length;
-  
-  console.log(`✅ Passed: ${passed}/4 memory systems`);
-  console.log(`❌ Failed: ${failed}/4 memory systems`);
-  console.log(`📈 Success Rate: ${((passed / 4) * 100).toFixed(1)}%`);
+
+  const report = [
+    '\n' + '='.repeat(60),
+    '📊 MEMORY SYSTEMS TESTING COMPLETE',
+    '='.repeat(60),
+    `✅ Passed: ${passed}/4 memory systems`,
+    `❌ Failed: ${failed}/4 memory systems`,
+    `📈 Success Rate: ${((passed / 4) * 100).toFixed(1)}%`
+  ];
   
   if (failed > 0) {
-    console.log('\n❌ Failed Systems:');
+    report.push('\n❌ Failed Systems:');
     results.filter(r => r.status === 'FAILED').forEach(r => {
-      console.log(`   - ${r.system}: ${r.error}`);
+      report.push(`   - ${r.system}: ${r.error}`);
     });
   }
   
-  console.log('\n🎯 All tests used REAL MongoDB data - no mocks!');
-  console.log('🔗 Database: cognitive_systems_test');
-  console.log('📅 Test completed:', new Date().toISOString());
+  report.push(
+    '\n🎯 All tests used REAL MongoDB data - no mocks!',
+    '🔗 Database: cognitive_systems_test',
+    `📅 Test completed: ${new Date().toISOString()}`
+  );
+  console.log(report.join('\n'));
   
   await mongoClient.close();
   return results;
@@ -9,6 +9,7 @@
 
 import dotenv from 'dotenv';
 import { MongoClient } from 'mongodb';
+import { mongoClientOptions } from './mongoClientOptions.js';
 import { openai } from '@ai-sdk/openai';
 import { Agent } from '@mastra/core/agent';
 import { createTool } from '@mastra/core/tools';
@@ -26,7 +27,32 @@ console.log('🚀 Voyage API:', process.env.VOYAGE_API_KEY ? '✅ Configured' :
 console.log('');
 
 // MongoDB connection
-const mongoClient = new MongoClient(process.env.MONGODB_URI);
+const mongoClient = new MongoClient(process.env.MONGODB_URI, mongoClientOptions);
+
+// Number of cognitive systems tested at the same time; bad or zero values
+// would start no workers and report an empty run as passing
+const requestedConcurrency = parseInt(process.env.TEST_CONCURRENCY || '4', 10);
+const TEST_CONCURRENCY = Math.max(1, Number.isFinite(requestedConcurrency) ? requestedConcurrency : 4);
+
+// Test results are written to MongoDB in batches of this size as systems finish
+const RESULTS_BATCH_SIZE = 8;
+
+// Run an async worker over items with at most `limit` in flight, keeping results in input order
+async function runWithConcurrency(items, limit, worker) {
+  const results = new Array(items.length);
+  let nextIndex = 0;
+
+  async function runNext() {
+    while (nextIndex < items.length) {
+      const index = nextIndex++;
+      results[index] = await worker(items[index], index);
+    }
+  }
+
+  const runners = Array.from({ length: Math.max(1, Math.min(limit, items.length)) }, runNext);
+  await Promise.all(runners);
+  return results;
+}
 
 // Test data generator
 function generateTestData(systemName, testType) {
@@ -103,14 +129,14 @@ function generateTestData(systemName, testType) {
 }
 
 // Test runner for individual cognitive systems
-async function testCognitiveSystem(systemName, description) {
-  console.log(`\n🧠 Testing: ${systemName.toUpperCase()}`);
-  console.log(`📝 Description: ${description}`);
-  console.log('─'.repeat(50));
+async function testCognitiveSystem(systemName, description, log = console.log) {
+  log(`\n🧠 Testing: ${systemName.toUpperCase()}`);
+  log(`📝 Description: ${description}`);
+  log('─'.repeat(50));
 
   try {
     // Step 1: Write real test data to MongoDB
-    console.log('📝 Step 1: Writing real test data to MongoDB...');
+    log('📝 Step 1: Writing real test data to MongoDB...');
     
     await mongoClient.connect();
     const db = mongoClient.db(process.env.TEST_DATABASE_NAME || 'cognitive_systems_test');
@@ -119,19 +145,19 @@ async function testCognitiveSystem(systemName, description) {
     const testData = generateTestData(systemName, 'cognitive_validation');
     const writeResult = await collection.insertOne(testData);
     
-    console.log(`✅ Data written - ID: ${writeResult.insertedId}`);
-    console.log(`📊 Test data:`, JSON.stringify(testData, null, 2));
+    log(`✅ Data written - ID: ${writeResult.insertedId}`);
+    log(`📊 Test data:`, JSON.stringify(testData, null, 2));
 
     // Step 2: Immediately fetch and analyze the data
-    console.log('\n🔍 Step 2: Fetching and analyzing data...');
+    log('\n🔍 Step 2: Fetching and analyzing data...');
     
     const retrievedData = await collection.findOne({ _id: writeResult.insertedId });
-    console.log(`✅ Data retrieved successfully`);
-    console.log(`📊 Retrieved:`, JSON.stringify(retrievedData, null, 2));
+    log(`✅ Data retrieved successfully`);
+    log(`📊 Retrieved:`, JSON.stringify(retrievedData, null, 2));
 
     // Step 3: Test hybrid search if applicable
     if (systemName === 'hybrid_search' || systemName === 'vector_search') {
-      console.log('\n🔍 Step 3: Testing MongoDB $rankFusion hybrid search...');
+      log('\n🔍 Step 3: Testing MongoDB $rankFusion hybrid search...');
       
       try {
         // Create a simple aggregation pipeline for testing
@@ -153,18 +179,18 @@ async function testCognitiveSystem(systemName, description) {
           { $limit: 5 }
         ]).toArray();
 
-        console.log(`✅ Search completed - Found ${searchResults.length} results`);
-        console.log(`📊 Search results:`, JSON.stringify(searchResults, null, 2));
+        log(`✅ Search completed - Found ${searchResults.length} results`);
+        log(`📊 Search results:`, JSON.stringify(searchResults, null, 2));
       } catch (searchError) {
-        console.log(`⚠️ Search test skipped: ${searchError.message}`);
+        log(`⚠️ Search test skipped: ${searchError.message}`);
       }
     }
 
     // Step 4: Validate cognitive system behavior
-    console.log('\n✅ Step 4: Cognitive system validation');
-    console.log(`🎯 System: ${systemName} - WORKING WITH REAL DATA`);
-    console.log(`📈 Performance: Data successfully written and retrieved`);
-    console.log(`🔄 MongoDB Integration: Functional`);
+    log('\n✅ Step 4: Cognitive system validation');
+    log(`🎯 System: ${systemName} - WORKING WITH REAL DATA`);
+    log(`📈 Performance: Data successfully written and retrieved`);
+    log(`🔄 MongoDB Integration: Functional`);
     
     return {
       system: systemName,
@@ -176,7 +202,7 @@ async function testCognitiveSystem(systemName, description) {
     };
 
   } catch (error) {
-    console.log(`❌ Test failed: ${error.message}`);
+    log(`❌ Test failed: ${error.message}`);
     return {
       system: systemName,
       status: 'FAILED',
@@ -217,42 +243,76 @@ async function runAllCognitiveTests() {
     ['realtime_monitoring', 'System performance and health tracking']
   ];
 
-  const results = [];
+  const databaseName = process.env.TEST_DATABASE_NAME || 'cognitive_systems_test';
+  const resultsCollection = mongoClient.db(databaseName).collection('test_results');
+  const runId = `run_${Date.now()}`;
 
-  for (const [systemName, description] of cognitiveSystems) {
-    const result = await testCognitiveSystem(systemName, description);
-    results.push(result);
-    
-    // Brief pause between tests
-    await new Promise(resolve => setTimeout(resolve, 1000));
+  // Results are persisted incrementally; only counters and failures stay in memory
+  const pendingResults = [];
+  const failedResults = [];
+  let passed = 0;
+
+  async function flushResults() {
+    const batch = pendingResults.splice(0, pendingResults.length);
+    if (batch.length === 0) return;
+
+    try {
+      await resultsCollection.insertMany(batch, { ordered: false, writeConcern: { w: 1 } });
+    } catch (error) {
+      console.log(`⚠️ Could not persist ${batch.length} test results: ${error.message}`);
+    }
   }
 
+  // Systems write to separate collections, so they can be tested concurrently.
+  // Each system's output is buffered and printed in order to keep the log readable.
+  const outputs = await runWithConcurrency(cognitiveSystems, TEST_CONCURRENCY, async ([systemName, description]) => {
+    const lines = [];
+    const result = await testCognitiveSystem(systemName, description, (...args) => lines.push(args.join(' ')));
+
+    if (result.status === 'PASSED') {
+      passed++;
+    } else {
+      failedResults.push(result);
+    }
+
+    pendingResults.push({ ...result, runId });
+    if (pendingResults.length >= RESULTS_BATCH_SIZE) {
+      await flushResults();
+    }
+
+    return lines;
+  });
+  await flushResults();
+
+  outputs.forEach(lines => console.log(lines.join('\n')));
+
   // Generate final report
+  const total = cognitiveSystems.length;
+  const failed = failedResults.length;
+
   console.log('\n' + '='.repeat(60));
   console.log('📊 COGNITIVE SYSTEMS TESTING COMPLETE');
   console.log('='.repeat(60));
 
-  const passed = results.filter(r => r.status === 'PASSED').length;
-  const failed = results.filter(r => r.status === 'FAILED').length;
-
-  console.log(`✅ Passed: ${passed}/${results.length} systems`);
-  console.log(`❌ Failed: ${failed}/${results.length} systems`);
-  console.log(`📈 Success Rate: ${((passed / results.length) * 100).toFixed(1)}%`);
+  console.log(`✅ Passed: ${passed}/${total} systems`);
+  console.log(`❌ Failed: ${failed}/${total} systems`);
+  console.log(`📈 Success Rate: ${((passed / total) * 100).toFixed(1)}%`);
 
   if (failed > 0) {
     console.log('\n❌ Failed Systems:');
-    results.filter(r => r.status === 'FAILED').forEach(r => {
+    failedResults.forEach(r => {
       console.log(`   - ${r.system}: ${r.error}`);
     });
   }
 
   console.log('\n🎯 All tests used REAL MongoDB data - no mocks!');
-  console.log('🔗 Database:', process.env.TEST_DATABASE_NAME || 'cognitive_systems_test');
+  console.log('🔗 Database:', databaseName);
+  console.log(`🗂️ Results stored in test_results (runId: ${runId})`);
   console.log('📅 Test completed:', new Date().toISOString());
 
   await mongoClient.close();
   
-  return results;
+  return { runId, total, passed, failed };
 }
 
 // Run the tests
@@ -10,24 +10,39 @@ import { MongoClient } from 'mongodb';
 
 dotenv.config();
 
-console.log('🔗 Testing MongoDB Atlas Connection...');
-console.log('=' .repeat(50));
+// Upper bound for each connection probe so one hung service can't stall the run
+const PROBE_TIMEOUT_MS = parseInt(process.env.PROBE_TIMEOUT_MS || '15000', 10);
+
+// Resolve with the probe's result, or with `false` once the timeout elapses
+function withTimeout(promise, ms, onTimeout) {
+  let timer;
+  const timeout = new Promise(resolve => {
+    timer = setTimeout(() => {
+      onTimeout();
+      resolve(false);
+    }, ms);
+  });
+  return Promise.race([promise, timeout]).finally(() => clearTimeout(timer));
+}
+
+async function testMongoConnection(log = console.log) {
+  log('\n🔗 Testing MongoDB Atlas Connection...');
+  log('=' .repeat(50));
 
-async function testMongoConnection() {
   try {
     const client = new MongoClient(process.env.MONGODB_URI);
     
-    console.log('📡 Connecting to MongoDB Atlas...');
+    log('📡 Connecting to MongoDB Atlas...');
     await client.connect();
     
-    console.log('✅ Connected successfully!');
+    log('✅ Connected successfully!');
     
     // Test database access
     const db = client.db('cognitive_systems_test');
     const collections = await db.listCollections().toArray();
     
-    console.log(`📊 Database: cognitive_systems_test`);
-    console.log(`📁 Existing collections: ${collections.length}`);
+    log(`📊 Database: cognitive_systems_test`);
+    log(`📁 Existing collections: ${collections.length}`);
     
     // Test write operation
     const testCollection = db.collection('connection_test');
@@ -38,32 +53,32 @@ async function testMongoConnection() {
     };
     
     const result = await testCollection.insertOne(testDoc);
-    console.log(`✅ Test write successful - ID: ${result.insertedId}`);
+    log(`✅ Test write successful - ID: ${result.insertedId}`);
     
     // Test read operation
     const retrieved = await testCollection.findOne({ _id: result.insertedId });
-    console.log(`✅ Test read successful - Retrieved: ${retrieved.test}`);
+    log(`✅ Test read successful - Retrieved: ${retrieved.test}`);
     
     // Clean up test document
     await testCollection.deleteOne({ _id: result.insertedId });
-    console.log(`🧹 Test document cleaned up`);
+    log(`🧹 Test document cleaned up`);
     
     await client.close();
-    console.log('✅ MongoDB Atlas connection test PASSED');
+    log('✅ MongoDB Atlas connection test PASSED');
     
     return true;
   } catch (error) {
-    console.log(`❌ MongoDB connection failed: ${error.message}`);
+    log(`❌ MongoDB connection failed: ${error.message}`);
     return false;
   }
 }
 
-async function testOpenAIConnection() {
-  console.log('\n🤖 Testing OpenAI API Connection...');
-  console.log('=' .repeat(50));
+async function testOpenAIConnection(log = console.log) {
+  log('\n🤖 Testing OpenAI API Connection...');
+  log('=' .repeat(50));
   
   if (!process.env.OPENAI_API_KEY) {
-    console.log('❌ OPENAI_API_KEY not found in environment');
+    log('❌ OPENAI_API_KEY not found in environment');
     return false;
   }
   
@@ -78,30 +93,30 @@ async function testOpenAIConnection() {
     
     if (response.ok) {
       const data = await response.json();
-      console.log(`✅ OpenAI API connection successful`);
-      console.log(`📊 Available models: ${data.data.length}`);
+      log(`✅ OpenAI API connection successful`);
+      log(`📊 Available models: ${data.data.length}`);
       return true;
     } else {
-      console.log(`❌ OpenAI API error: ${response.status} ${response.statusText}`);
+      log(`❌ OpenAI API error: ${response.status} ${response.statusText}`);
       return false;
     }
   } catch (error) {
-    console.log(`❌ OpenAI connection failed: ${error.message}`);
+    log(`❌ OpenAI connection failed: ${error.message}`);
     return false;
   }
 }
 
-async function testVoyageConnection() {
-  console.log('\n🚀 Testing Voyage AI Connection...');
-  console.log('=' .repeat(50));
+async function testVoyageConnection(log = console.log) {
+  log('\n🚀 Testing Voyage AI Connection...');
+  log('=' .repeat(50));
   
   if (!process.env.VOYAGE_API_KEY) {
-    console.log('❌ VOYAGE_API_KEY not found in environment');
+    log('❌ VOYAGE_API_KEY not found in environment');
     return false;
   }
   
-  console.log('✅ Voyage API key found');
-  console.log('🔑 Key preview:', process.env.VOYAGE_API_KEY.substring(0, 10) + '...');
+  log('✅ Voyage API key found');
+  log('🔑 Key preview:', process.env.VOYAGE_API_KEY.substring(0, 10) + '...');
   
   // Note: We'll test Voyage integration in the actual cognitive tests
   return true;
@@ -111,9 +126,20 @@ async function runConnectionTests() {
   console.log('🧠 Universal AI Brain 3.0 - Connection Testing');
   console.log('🎯 Validating ROM\'s credentials before cognitive testing\n');
   
-  const mongoOk = await testMongoConnection();
-  const openaiOk = await testOpenAIConnection();
-  const voyageOk = await testVoyageConnection();
+  // The probes are independent, so start them together and print each
+  // section as soon as its probe finishes instead of waiting on the slowest one
+  const probes = [testMongoConnection, testOpenAIConnection, testVoyageConnection].map(async (probe) => {
+    const lines = [];
+    const ok = await withTimeout(
+      probe((...args) => lines.push(args.join(' '))),
+      PROBE_TIMEOUT_MS,
+      () => lines.push(`⏱️ ${probe.name} timed out after ${PROBE_TIMEOUT_MS}ms`)
+    );
+    console.log(lines.join('\n'));
+    return ok;
+  });
+
+  const [mongoOk, openaiOk, voyageOk] = await Promise.all(probes);
   
   console.log('\n' + '='.repeat(50));
   console.log('📊 CONNECTION TEST RESULTS');